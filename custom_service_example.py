@@ -109,7 +109,9 @@ async def demo_dynamic_service_modification():
     # Start with existing service
     async with UpstoxService() as upstox:
 
-        # Add new endpoints dynamically
+        # Add new endpoints dynamically (the class table is shared and
+        # read-only, so extend a copy owned by this instance)
+        upstox._ENDPOINTS = dict(upstox.get_service_endpoints())
         upstox._ENDPOINTS["custom_market_data"] = EndpointConfig(
             path="custom/market-data/{symbol}",
             method="GET",
@@ -63,18 +63,25 @@ Core concepts:
 """
 
 import asyncio  # Python's built-in async programming library
+import hashlib  # For fingerprinting credentials in cache keys
 import json  # For JSON parsing
 import logging  # For recording what the program is doing (debugging, monitoring)
 import time  # For timestamps and timing operations
+import weakref  # Per-event-loop registry of shared connection pools
 from collections import \
     deque  # Fast queue data structure for recent request tracking
+from collections import OrderedDict  # Recency-ordered storage for the LRU cache
+from decimal import Decimal  # Order prices are held as Decimal
+from functools import lru_cache  # Memoize parsed URLs
 from typing import Dict  # Type hints for better code documentation
 from typing import Any, List, Optional
+from urllib.parse import urlsplit  # Host extraction for shared pools
 
 try:
     # aiohttp: The async HTTP client library (like requests, but async)
     import aiohttp
     from aiohttp import ClientSession, ClientTimeout, TCPConnector
+    from yarl import URL  # aiohttp's URL type (installed with aiohttp)
 except ImportError as exc:
     # If aiohttp isn't installed, provide clear installation instructions
     raise ImportError(
@@ -83,11 +90,143 @@ except ImportError as exc:
         "HTTP requests essential for high-performance trading applications."
     ) from exc
 
+try:
+    # orjson: optional C JSON library, several times faster than the stdlib for
+    # order payloads and large responses. Falls back to json when absent.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON libraries don't know, such as Decimal prices."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize a JSON request body for aiohttp.
+
+    Uses orjson when installed, falling back to the stdlib for payloads it
+    rejects (e.g. non-string dict keys) so behaviour matches json.dumps.
+    Decimal values (order prices) are sent as JSON numbers.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=_json_default)
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse a JSON response body.
+
+    Uses orjson when installed (large payloads such as the instrument master
+    parse several times faster), retrying with the stdlib for documents only
+    it accepts (e.g. NaN literals). Invalid JSON raises json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 # Logger for recording what's happening in our network operations
 # Essential for debugging trading issues ("Why did my order fail?")
 logger = logging.getLogger(__name__)
 
 
+def _make_connector(max_connections: int, keepalive_timeout: float) -> TCPConnector:
+    """Build a TCPConnector (HTTP connection pool) tuned for trading APIs."""
+    return TCPConnector(
+        limit=max_connections,  # Total connections across all hosts
+        limit_per_host=max_connections,  # 🚀 Match total limit for single-host usage
+        keepalive_timeout=keepalive_timeout,  # 🚀 Idle connection reuse window
+        enable_cleanup_closed=True,  # Automatically clean up closed connections
+        use_dns_cache=True,    # 🚀 Enable DNS caching for faster lookups
+        ttl_dns_cache=300,     # 🚀 Cache DNS for 5 minutes
+    )
+
+
+# Shared connection pools: event loop -> host -> connector.
+# Connectors are bound to the loop they were created in, so pools are kept
+# per loop and dropped automatically when that loop is garbage collected.
+_SHARED_CONNECTORS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_shared_connector(
+    base_url: str, max_connections: int = 100, keepalive_timeout: float = 60
+) -> TCPConnector:
+    """
+    Return the connection pool shared by every client talking to base_url's host.
+
+    Clients built with the same shared connector reuse each other's open
+    TCP/TLS connections instead of each paying for its own handshakes. The
+    pool is created on first use with the given limits; later callers get
+    the existing pool unchanged. Must be called inside a running event loop.
+
+    Shared pools are not closed with the clients using them; call
+    close_shared_connectors() at shutdown.
+    """
+    host = urlsplit(base_url).netloc
+    pools = _SHARED_CONNECTORS.setdefault(asyncio.get_running_loop(), {})
+    connector = pools.get(host)
+    if connector is None or connector.closed:
+        connector = pools[host] = _make_connector(max_connections, keepalive_timeout)
+    return connector
+
+
+async def close_shared_connectors() -> None:
+    """Close every shared connection pool created in the running event loop."""
+    pools = _SHARED_CONNECTORS.pop(asyncio.get_running_loop(), {})
+    for connector in pools.values():
+        await connector.close()
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> URL:
+    """
+    Parse and percent-encode a request URL once.
+
+    aiohttp parses every str URL it is given; endpoint URLs repeat across
+    requests, so the immutable parsed URL is memoized and reused instead.
+    """
+    return URL(url)
+
+
+# Headers the trading services authenticate with (lower-cased): bearer/basic
+# and XTS interactive tokens, Upstox API keys, Groww sessions, XTS market tokens
+_CREDENTIAL_HEADERS = frozenset(
+    ("authorization", "x-api-key", "x-session-token", "x-market-token", "cookie")
+)
+
+
+def _credential_headers(headers: Dict[str, str]) -> str:
+    """Credential header values of a request, in a stable order ("" when none)."""
+    return "\n".join(sorted(
+        f"{name.lower()}:{value}"
+        for name, value in headers.items()
+        if value and name.lower() in _CREDENTIAL_HEADERS
+    ))
+
+
+def _auth_fingerprint(credentials: str) -> str:
+    """
+    Short, non-reversible fingerprint of a request's credential headers.
+
+    Used to namespace cached responses per principal so one user's token
+    never serves another user's cached data. Not memoized, so raw tokens
+    are not kept alive once a request is done.
+    """
+    return hashlib.blake2b(credentials.encode(), digest_size=8).hexdigest()
+
+
 class SimpleResponse:
     """Simple response object to hold response data after the aiohttp context closes"""
 
@@ -439,13 +578,19 @@ class AsyncCache:
     - Coroutine B waits for lock, then reads complete entry
 
     === DATA STRUCTURE ===
-    Cache stores: Dict[key, (value, expiry_timestamp)]
+    Cache stores: OrderedDict[key, (value, expiry_timestamp)]
     - key: String identifier (e.g., "AAPL_price", "account_balance")
     - value: The actual cached data (price, balance, etc.)
     - expiry_timestamp: Unix timestamp when this data expires
+
+    === SIZE LIMIT (LRU) ===
+    Entries are kept in least-recently-used order. Once max_entries is
+    reached, storing a new key evicts the entry that was used longest ago,
+    so many distinct requests (e.g. quotes across a large watchlist) cannot
+    grow memory without bound between cleanup_expired() calls.
     """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_entries: int = 1024):
         """
         Initialize the async cache.
 
@@ -456,12 +601,15 @@ class AsyncCache:
                         - 30-60s: Account info
                         - 300s (5min): Static reference data
                         - 3600s (1hr): Rarely changing data
+            max_entries: Maximum number of cached responses; the least recently
+                        used entry is evicted when a new one would exceed it
         """
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
 
-        # Internal cache storage: key -> (value, expiry_timestamp)
+        # Internal cache storage: key -> (value, expiry_timestamp), oldest use first
         # Example: {"AAPL_price": (150.25, 1697890865.123)}
-        self._cache: Dict[str, tuple] = {}
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
 
         # Async lock to prevent concurrent access issues
         self._lock = asyncio.Lock()
@@ -504,6 +652,7 @@ class AsyncCache:
 
                 # Check if data is still fresh
                 if time.time() < expiry:
+                    self._cache.move_to_end(key)  # Mark as most recently used
                     return value  # Cache hit! Return fresh data
                 else:
                     # Data expired, remove it and act like it never existed
@@ -538,6 +687,9 @@ class AsyncCache:
         async with self._lock:
             # Store as tuple: (actual_data, expiry_timestamp)
             self._cache[key] = (value, expiry)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)  # Evict least recently used
 
     async def clear(self) -> None:
         """
@@ -681,6 +833,9 @@ class AsyncNetworkClient:
         cache_ttl: int = 60,
         enable_circuit_breaker: bool = True,
         default_headers: Optional[Dict[str, str]] = None,
+        keepalive_timeout: float = 60,
+        connector: Optional[TCPConnector] = None,
+        cache_max_entries: int = 1024,
     ):
         """
         Initialize the async network client with trading-optimized defaults.
@@ -713,6 +868,17 @@ class AsyncNetworkClient:
             default_headers: Default headers to include in all requests
                            Examples: {"User-Agent": "MyBot/1.0", "Authorization": "Bearer token"}
                            Request-specific headers will override these defaults
+
+            keepalive_timeout: Seconds an idle pooled connection is kept open for reuse
+                             Longer = fewer TCP/TLS handshakes during bursty trading
+                             Shorter = idle sockets are released sooner
+
+            connector: Existing connection pool to use instead of a private one
+                      (see get_shared_connector). It is left open when this
+                      client closes, since other clients may share it.
+
+            cache_max_entries: Maximum number of cached responses kept at once
+                             (least recently used are evicted first)
         """
         # Store base URL and ensure it ends with slash for consistent URL building
         self.base_url = base_url.rstrip("/") + "/" if base_url else ""
@@ -725,7 +891,7 @@ class AsyncNetworkClient:
             rate_limit
         )  # Prevents API rate limit violations
         self.cache = AsyncCache(
-            cache_ttl
+            cache_ttl, cache_max_entries
         )  # Stores responses to avoid redundant requests
         self.max_retries = max_retries  # How many times to retry failed requests
 
@@ -739,15 +905,10 @@ class AsyncNetworkClient:
             connect=2,  # 🚀 Faster connection timeout (was 10s, now 2s)
         )
 
-        # TCPConnector: Manages the HTTP connection pool
-        connector = TCPConnector(
-            limit=max_connections,  # Total connections across all hosts
-            limit_per_host=max_connections,  # 🚀 Match total limit for single-host usage
-            keepalive_timeout=60,  # 🚀 Longer keep-alive (was 30s, now 60s)
-            enable_cleanup_closed=True,  # Automatically clean up closed connections
-            use_dns_cache=True,    # 🚀 Enable DNS caching for faster lookups
-            ttl_dns_cache=300,     # 🚀 Cache DNS for 5 minutes
-        )
+        # TCPConnector: Manages the HTTP connection pool (private unless one is shared in)
+        self._owns_connector = connector is None
+        if connector is None:
+            connector = _make_connector(max_connections, keepalive_timeout)
         # Why connection limits matter:
         # - Too many: Waste system resources (memory, file descriptors)
         # - Too few: Bottleneck your trading bot's performance
@@ -800,6 +961,8 @@ class AsyncNetworkClient:
             self._session = ClientSession(
                 timeout=self._timeout,
                 connector=self._connector,
+                connector_owner=self._owns_connector,
+                json_serialize=_json_dumps,
                 # headers=self.he,
                 # headers={
                 #     # Identify our trading bot to the API server
@@ -919,7 +1082,11 @@ class AsyncNetworkClient:
         return f"{self.base_url}{clean_endpoint}"
 
     def _generate_cache_key(
-        self, method: str, url: str, params: Optional[dict] = None
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        credentials: Optional[str] = None,
     ) -> str:
         """
         Generate a unique cache key for this request.
@@ -946,8 +1113,18 @@ class AsyncNetworkClient:
         - With sorting, both become [('limit', '10'), ('symbol', 'AAPL')]
 
         This prevents cache misses due to parameter order differences.
+
+        === PER-PRINCIPAL KEYS ===
+        When credential headers are sent (Authorization, X-API-Key,
+        X-Session-Token, x-market-token, Cookie), a fingerprint of them
+        prefixes the key:
+        - Two users hitting the same URL never share a cached response
+        - A refreshed token produces a new key, so stale entries are never served
+        - Unauthenticated (public) requests skip the prefix to maximize hit rate
         """
         key_parts = [method.upper(), url]
+        if credentials:
+            key_parts.insert(0, _auth_fingerprint(credentials))
         if params:
             # Sort parameters for consistent cache keys regardless of order
             sorted_params = sorted(params.items())
@@ -1090,6 +1267,7 @@ class AsyncNetworkClient:
         - Retry attempts: Log backoff time so you know what's happening
         """
         session = await self._get_session()
+        request_url = _parse_url(url)
         last_exception = None
         # Try the request up to (max_retries + 1) times total
         # Example: max_retries=3 means 4 total attempts (initial + 3 retries)
@@ -1105,7 +1283,7 @@ class AsyncNetworkClient:
                 # STEP 2: Make the actual HTTP request with timing
                 # start_time was set before the try block to ensure it's always available
 
-                async with session.request(method, url, **kwargs) as response:
+                async with session.request(method, request_url, **kwargs) as response:
                     duration = time.time() - start_time
 
                     # Log successful response (status code, timing)
@@ -1292,10 +1470,17 @@ class AsyncNetworkClient:
         url = self._build_url(endpoint)
         print("----", url)
 
+        # Merge default headers with request-specific headers
+        # Request headers take precedence over default headers
+        merged_headers = self.default_headers.copy()
+        if headers:
+            merged_headers.update(headers)
+
         # === STEP 1: CHECK CACHE FOR GET REQUESTS ===
         # Only GET requests can be cached (POST/PUT/DELETE change state)
         if method.upper() == "GET" and use_cache:
-            cache_key = self._generate_cache_key(method, url, params)
+            credentials = _credential_headers(merged_headers)
+            cache_key = self._generate_cache_key(method, url, params, credentials)
             cached_response = await self.cache.get(cache_key)
             if cached_response is not None:
                 logger.info(f"🎯 CACHE HIT: {method} {url}")
@@ -1323,12 +1508,6 @@ class AsyncNetworkClient:
             # aiohttp automatically sets Content-Type and serializes to JSON
             request_kwargs["json"] = json_data
 
-        # Merge default headers with request-specific headers
-        # Request headers take precedence over default headers
-        merged_headers = self.default_headers.copy()
-        if headers:
-            merged_headers.update(headers)
-
         if merged_headers:
             request_kwargs["headers"] = merged_headers
 
@@ -1359,7 +1538,7 @@ class AsyncNetworkClient:
             'application/javascript' in content_type or
             text_response.strip().startswith(('{', '['))):
             try:
-                json_response = json.loads(text_response)
+                json_response = _json_loads(text_response)
                 logger.debug(f"Successfully parsed JSON response from {url}")
             except (json.JSONDecodeError, ValueError) as e:
                 # JSON parsing failed - return raw text instead
@@ -1375,7 +1554,7 @@ class AsyncNetworkClient:
         # === STEP 5: CACHE SUCCESSFUL GET RESPONSES ===
         # Only cache GET requests to avoid caching state-changing operations
         if method.upper() == "GET" and use_cache:
-            cache_key = self._generate_cache_key(method, url, params)
+            # cache_key was computed in STEP 1 for this same request
             # Cache the response (whether it's JSON, text, or None)
             response_to_cache = json_response if 'json_response' in locals() else text_response
             await self.cache.set(cache_key, response_to_cache, cache_ttl)
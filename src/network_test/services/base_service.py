@@ -5,16 +5,46 @@ This module provides the abstract base class for all trading service implementat
 It implements the ITradingService interface and provides common functionality.
 """
 
-import base64
+import asyncio
+import binascii
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
-from ..network import AsyncNetworkClient
+from ..network import AsyncNetworkClient, get_shared_connector
 from .interface import ITradingService
 from .models import EndpointConfig, NetworkClientConfig
 from .scalable_architecture import (StandardizedOperationsMixin)
 
 
+def _encode_basic_credentials(username: str, password: str) -> str:
+    """Encode ``username:password`` (as UTF-8) for a Basic Authorization header."""
+    raw = f"{username}:{password}".encode()
+    return binascii.b2a_base64(raw, newline=False).decode("ascii")
+
+
+def _set_bearer_auth(headers: Dict[str, str], token: Optional[str]) -> None:
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+
+def _set_basic_auth(headers: Dict[str, str], credentials: Tuple[str, str]) -> None:
+    username, password = credentials
+    if username and password:
+        headers["Authorization"] = f"Basic {_encode_basic_credentials(username, password)}"
+
+
+def _set_api_key_auth(headers: Dict[str, str], spec: Tuple[str, str]) -> None:
+    header_name, key = spec
+    if key:
+        headers[header_name] = key
+
+
+def _set_header_auth(headers: Dict[str, str], auth_headers: Dict[str, str]) -> None:
+    for header_name, value in auth_headers.items():
+        if value:
+            headers[header_name] = value
+
+
 class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
     """
     Abstract base class for all trading service implementations.
@@ -34,9 +64,15 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
         - base_url (str): Base URL for the API
         - rate_limit (int): Requests per second
         - timeout (int): Request timeout (seconds)
-        - max_connections (int): Max concurrent connections
+        - max_connections (int): Max concurrent connections (default: 100)
+        - keepalive_expiry (int): Seconds idle pooled connections are kept alive (default: 30)
+        - share_connection_pool (bool): Reuse one connection pool per API host across
+          service instances (default: False; close with network.close_shared_connectors)
+        - max_inflight (int): Max concurrent call_endpoint requests (default: max_connections)
+        - enable_concurrency_limit (bool): Cap in-flight requests per service (default: True)
         - max_retries (int): Max retry attempts
         - cache_ttl (int): Default cache time-to-live (seconds)
+        - cache_max_entries (int): Max cached responses, LRU-evicted (default: 1024)
         - enable_circuit_breaker (bool): Enable circuit breaker
         - default_headers (dict): Default HTTP headers
         - endpoints (dict): Custom endpoint definitions
@@ -61,6 +97,14 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
     - Override authentication, endpoint, and config methods as needed.
     """
 
+    # Authentication scheme -> handler used by _apply_auth
+    _AUTH_HANDLERS: ClassVar[Dict[str, Callable[[Dict[str, str], Any], None]]] = {
+        "bearer": _set_bearer_auth,
+        "basic": _set_basic_auth,
+        "api_key": _set_api_key_auth,
+        "header": _set_header_auth,
+    }
+
     def __init__(self,
                  config: Optional[Dict[str, Any]] = None,
                  **client_overrides):
@@ -101,15 +145,32 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
             base_url=self.config.get("base_url", self.get_default_base_url()),
             rate_limit=self.config.get("rate_limit", 25),
             timeout=self.config.get("timeout", 10),
-            max_connections=self.config.get("max_connections", 20),
+            max_connections=self.config.get("max_connections", 100),
             max_retries=self.config.get("max_retries", 3),
             cache_ttl=self.config.get("cache_ttl", 30),
             enable_circuit_breaker=self.config.get("enable_circuit_breaker", True),
-            default_headers=base_headers
+            default_headers=base_headers,
+            keepalive_expiry=self.config.get("keepalive_expiry", 30),
+            cache_max_entries=self.config.get("cache_max_entries", 1024)
         )
 
         # Initialize the network client with configuration
-        self.client = AsyncNetworkClient(**client_config.to_dict())
+        client_kwargs = client_config.to_dict()
+        if self.config.get("share_connection_pool", False):
+            client_kwargs["connector"] = get_shared_connector(
+                client_config.base_url,
+                max_connections=client_config.max_connections,
+                keepalive_timeout=client_config.keepalive_expiry,
+            )
+        self.client = AsyncNetworkClient(**client_kwargs)
+
+        # Cap in-flight requests so bursts queue here instead of exhausting the pool.
+        # The semaphore itself is created lazily inside the running event loop.
+        self._inflight_limit = (
+            self.config.get("max_inflight", client_config.max_connections)
+            if self.config.get("enable_concurrency_limit", True) else None
+        )
+        self._inflight_semaphore: Optional[asyncio.Semaphore] = None
 
         # Initialize standardized operations support
         self.__init_standardized_operations__(self.get_service_name())
@@ -158,27 +219,43 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
             headers: Dictionary of headers to modify with authentication
         """
 
+    def _apply_auth(self, headers: Dict[str, str], auth_spec: Dict[str, Any]) -> None:
+        """
+        Apply one or more authentication schemes in a single pass.
+
+        Each key of ``auth_spec`` selects a handler from ``_AUTH_HANDLERS``:
+        - "bearer": token
+        - "basic": (username, password)
+        - "api_key": (header_name, key)
+        - "header": dict of header name -> value
+
+        Empty values are skipped, so optional credentials can be passed as-is.
+
+        Example:
+            self._apply_auth(headers, {
+                "bearer": self.config.get("access_token"),
+                "api_key": ("X-API-Key", self.config.get("api_key")),
+            })
+        """
+        handlers = self._AUTH_HANDLERS
+        for scheme, value in auth_spec.items():
+            handlers[scheme](headers, value)
+
     def _add_bearer_token(self, headers: Dict[str, str], token: str) -> None:
         """Helper method to add Bearer token authentication."""
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
+        _set_bearer_auth(headers, token)
 
     def _add_api_key_header(self, headers: Dict[str, str], key: str, header_name: str = "X-API-Key") -> None:
         """Helper method to add API key to headers."""
-        if key:
-            headers[header_name] = key
+        _set_api_key_auth(headers, (header_name, key))
 
     def _add_basic_auth(self, headers: Dict[str, str], username: str, password: str) -> None:
         """Helper method to add Basic authentication."""
-        if username and password:
-            credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-            headers["Authorization"] = f"Basic {credentials}"
+        _set_basic_auth(headers, (username, password))
 
     def _add_custom_auth(self, headers: Dict[str, str], auth_config: Dict[str, str]) -> None:
         """Helper method to add custom authentication headers from config."""
-        for header_name, value in auth_config.items():
-            if value:
-                headers[header_name] = value
+        _set_header_auth(headers, auth_config)
 
     def _load_custom_endpoints(self, endpoints_config: Dict[str, Any]) -> None:
         """Load custom endpoints from configuration."""
@@ -194,6 +271,12 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
             service_endpoints = self.get_service_endpoints()
             service_endpoints[name] = endpoint_config
 
+    def _get_inflight_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Return the in-flight request semaphore, creating it on first use."""
+        if self._inflight_semaphore is None and self._inflight_limit:
+            self._inflight_semaphore = asyncio.Semaphore(self._inflight_limit)
+        return self._inflight_semaphore
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self.client.__aenter__()
@@ -208,6 +291,7 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
                           path_params: Optional[Dict[str, str]] = None,
                           query_params: Optional[Dict[str, Any]] = None,
                           json_data: Optional[Dict[str, Any]] = None,
+                          base_url_override: Optional[str] = None,
                           **kwargs) -> Any:
         """
         Call a predefined endpoint with proper configuration.
@@ -217,6 +301,8 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
             path_params: Parameters to substitute in the path
             query_params: Query parameters
             json_data: JSON payload for POST/PUT requests
+            base_url_override: Base URL (ending in "/") to use for this call
+                instead of the client's; the shared client is not modified
             **kwargs: Override endpoint configuration
 
         Returns:
@@ -230,22 +316,24 @@ class BaseTradingService(ITradingService, StandardizedOperationsMixin, ABC):
         config = endpoints[endpoint_name]
 
         # Build the endpoint path with parameter substitution
-        endpoint_path = config.path
-        if path_params:
-            endpoint_path = endpoint_path.format(**path_params)
-
-        # Use endpoint config with optional overrides
-        request_config = {
-            "method": config.method,
-            "endpoint": endpoint_path,
-            "params": query_params,
-            "json_data": json_data,
-            "use_cache": config.use_cache,
-            "cache_ttl": config.cache_ttl,
-            **kwargs  # Allow overriding any config
-        }
-
-        return await self.client.request(**request_config)
+        endpoint_path = config.format_path(path_params) if path_params else config.path
+        if base_url_override:
+            # Absolute URLs are sent as-is by the client
+            endpoint_path = f"{base_url_override}{endpoint_path.lstrip('/')}"
+
+        # Start from the endpoint's prebuilt template and overlay per-call fields
+        request_config = config.request_template.copy()
+        request_config["endpoint"] = endpoint_path
+        request_config["params"] = query_params
+        request_config["json_data"] = json_data
+        if kwargs:
+            request_config.update(kwargs)  # Allow overriding any config
+
+        semaphore = self._get_inflight_semaphore()
+        if semaphore is None:
+            return await self.client.request(**request_config)
+        async with semaphore:
+            return await self.client.request(**request_config)
 
     def list_endpoints(self) -> Dict[str, Any]:
         """List all available endpoints with descriptions"""
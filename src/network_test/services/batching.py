@@ -0,0 +1,81 @@
+"""
+Request batching for trading services.
+
+Coalesces concurrent single-key lookups (e.g. one quote per instrument) made
+within a short window into one backend call, then hands each caller its own
+slice of the response.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+# Fetches results for several keys at once; keys missing from the returned
+# mapping resolve to None
+BatchFetcher = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class RequestBatcher:
+    """
+    Batch concurrent lookups into as few backend calls as possible.
+
+    Calls to ``get`` made within ``batch_interval_ms`` of the first pending
+    call are sent together, and a batch is sent immediately once it holds
+    ``max_batch_size`` distinct keys. Identical keys in the same batch share
+    one result.
+
+    Must be created and used inside a running event loop.
+
+    Example:
+        batcher = RequestBatcher(fetch_quotes, batch_interval_ms=10, max_batch_size=20)
+        quotes = await asyncio.gather(*(batcher.get(key) for key in keys))
+    """
+
+    def __init__(self,
+                 fetch: BatchFetcher,
+                 batch_interval_ms: float = 10,
+                 max_batch_size: int = 20):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._fetch = fetch
+        self._delay = batch_interval_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # In-flight batch tasks, referenced so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, key: str) -> Any:
+        """Return the result for ``key``, batched with other pending lookups."""
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self._delay, self._flush)
+        # Shield so one cancelled caller does not cancel a result others await
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Send every pending key as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self._fetch(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
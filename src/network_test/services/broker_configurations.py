@@ -37,16 +37,33 @@ result = await any_broker.place_order_standard(symbol="RELIANCE", quantity=10)
 The magic happens automatically behind the scenes!
 """
 
-from typing import Any, Callable, Dict
+import logging
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict
 
 from .scalable_architecture import (BrokerConfigurationBuilder,
-                                    EndpointCategory, OperationType,
-                                    ParameterSchema, ParameterSchemaRegistry)
+                                    BrokerMappingRegistry,
+                                    EndpointCategory, OperationConfig,
+                                    OperationType, ParameterSchema,
+                                    ParameterSchemaRegistry)
+
+logger = logging.getLogger(__name__)
 
 # =====================================================
 # PARAMETER VALIDATION RULES
 # =====================================================
 
+# Most brokers cap how many instruments one quote request may ask for
+MAX_QUOTE_SYMBOLS = 50
+
+# Field-name tuples shared by every broker table and global schema
+_ORDER_REQUIRED = ('symbol', 'exchange', 'quantity', 'order_side', 'order_type', 'product_type')
+_ORDER_OPTIONAL = ('price', 'trigger_price', 'validity', 'disclosed_quantity', 'tag', 'is_amo')
+_ORDER_ID_REQUIRED = ('order_id',)
+_QUOTE_REQUIRED = ('symbols',)
+_EXCHANGE_OPTIONAL = ('exchange',)
+_EMPTY = ()
+
 def validate_order_params(params: Dict[str, Any]) -> list[str]:
     """
     🛡️ Order Validation - Like a Safety Inspector!
@@ -72,18 +89,20 @@ def validate_order_params(params: Dict[str, Any]) -> list[str]:
         validate_order_params({'quantity': 10}) → [] (all good!)
     """
     errors = []
+    append = errors.append
+    get = params.get
 
     # Check quantity is positive (you can't buy -5 apples!)
-    if params.get('quantity', 0) <= 0:
-        errors.append("Quantity must be positive")
+    if get('quantity', 0) <= 0:
+        append("Quantity must be positive")
 
     # Check limit orders have prices (like asking for "expensive food" but not saying how much)
-    if params.get('order_type') == 'LIMIT' and not params.get('price'):
-        errors.append("Limit orders require price")
+    if get('order_type') == 'LIMIT' and not get('price'):
+        append("Limit orders require price")
 
     # Check trigger price isn't negative (can't trigger at negative money!)
-    if params.get('trigger_price', 0) < 0:
-        errors.append("Trigger price cannot be negative")
+    if get('trigger_price', 0) < 0:
+        append("Trigger price cannot be negative")
 
     return errors
 
@@ -112,15 +131,15 @@ def validate_quote_params(params: Dict[str, Any]) -> list[str]:
     """
     errors = []
 
-    symbols = params.get('symbols', [])
+    symbol_count = len(params.get('symbols') or ())
 
     # Check you asked for at least one stock (like going to store with empty list)
-    if not symbols or len(symbols) == 0:
+    if symbol_count == 0:
         errors.append("At least one symbol is required")
 
     # Check you didn't ask for too many (brokers have limits, like store cashiers!)
-    if len(symbols) > 50:  # Most brokers have limits
-        errors.append("Too many symbols requested (max 50)")
+    elif symbol_count > MAX_QUOTE_SYMBOLS:
+        errors.append(f"Too many symbols requested (max {MAX_QUOTE_SYMBOLS})")
 
     return errors
 
@@ -143,7 +162,7 @@ class BrokerMappingConfig:
     - English → Spanish dictionary
     - If French changes, Spanish dictionary is unaffected!
     """
-    pass
+    __slots__ = ()
 
 class UpstoxMappings:
     """
@@ -152,6 +171,7 @@ class UpstoxMappings:
     All Upstox mappings in one place - easy to find and modify!
     Following Single Responsibility: ONLY handles Upstox mappings.
     """
+    __slots__ = ()
 
     # Product type mappings
     PRODUCT_TYPE_MAP = {
@@ -190,6 +210,7 @@ class XTSMappings:
     All XTS mappings in one place - completely separate from Upstox!
     Following Single Responsibility and Open/Closed principles.
     """
+    __slots__ = ()
 
     # Product type mappings
     PRODUCT_TYPE_MAP = {
@@ -236,6 +257,7 @@ class IParameterTransformer(ABC):
     - Easy to implement for any broker
     - Clients depend only on methods they use
     """
+    __slots__ = ()
 
     @abstractmethod
     def transform(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -255,6 +277,8 @@ class MappingBasedTransformer(IParameterTransformer):
     - Open for extension (new brokers)
     - Closed for modification (core logic never changes)
     """
+    __slots__ = ('mappings', 'field_map', 'product_map', 'order_type_map', 'exchange_map',
+                 '_std_keys')
 
     def __init__(self, mappings_class):
         """
@@ -265,36 +289,59 @@ class MappingBasedTransformer(IParameterTransformer):
         """
         self.mappings = mappings_class
 
+        # Resolve the mapping tables once instead of on every transform() call
+        self.field_map = getattr(mappings_class, 'FIELD_MAP', {})
+        self.product_map = getattr(mappings_class, 'PRODUCT_TYPE_MAP', None)
+        self.order_type_map = getattr(mappings_class, 'ORDER_TYPE_MAP', None)
+        self.exchange_map = getattr(mappings_class, 'EXCHANGE_MAP', None)
+
+        # Standard fields this transformer rewrites: those the broker renames
+        # plus those whose values are mapped. A payload carrying none of them
+        # is already in broker-native form (e.g. a retried order)
+        value_mapped = (('product_type', self.product_map),
+                        ('order_type', self.order_type_map),
+                        ('exchange', self.exchange_map))
+        self._std_keys = frozenset(
+            [field for field, target in self.field_map.items() if field != target]
+            + [field for field, value_map in value_mapped if value_map is not None]
+        )
+
     def transform(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         🔄 Universal Transform Method
 
         This method works for ANY broker because it uses dependency injection!
         The magic happens through the mappings, not hardcoded logic.
+
+        Already-transformed (broker-native) params are returned as a shallow
+        copy without being walked again.
         """
+        if not params.keys() & self._std_keys:
+            return dict(params)
+
+        field_map = self.field_map
         result = {}
 
         # Transform field names
         for standard_field, value in params.items():
-            broker_field = getattr(self.mappings, 'FIELD_MAP', {}).get(standard_field, standard_field)
-            result[broker_field] = value
+            result[field_map.get(standard_field, standard_field)] = value
 
         # Apply value mappings
-        if hasattr(self.mappings, 'PRODUCT_TYPE_MAP') and 'product_type' in params:
-            mapped_field = getattr(self.mappings, 'FIELD_MAP', {}).get('product_type', 'product_type')
-            result[mapped_field] = self.mappings.PRODUCT_TYPE_MAP.get(params['product_type'], params['product_type'])
+        if self.product_map is not None and 'product_type' in params:
+            mapped_field = field_map.get('product_type', 'product_type')
+            result[mapped_field] = self.product_map.get(params['product_type'], params['product_type'])
 
-        if hasattr(self.mappings, 'ORDER_TYPE_MAP') and 'order_type' in params:
-            mapped_field = getattr(self.mappings, 'FIELD_MAP', {}).get('order_type', 'order_type')
-            result[mapped_field] = self.mappings.ORDER_TYPE_MAP.get(params['order_type'], params['order_type'])
+        if self.order_type_map is not None and 'order_type' in params:
+            mapped_field = field_map.get('order_type', 'order_type')
+            result[mapped_field] = self.order_type_map.get(params['order_type'], params['order_type'])
 
-        if hasattr(self.mappings, 'EXCHANGE_MAP') and 'exchange' in params:
-            mapped_field = getattr(self.mappings, 'FIELD_MAP', {}).get('exchange', 'exchange')
-            result[mapped_field] = self.mappings.EXCHANGE_MAP.get(params['exchange'], params['exchange'])
+        if self.exchange_map is not None and 'exchange' in params:
+            mapped_field = field_map.get('exchange', 'exchange')
+            result[mapped_field] = self.exchange_map.get(params['exchange'], params['exchange'])
 
         # Special handling for symbol → instrument_token
         if 'symbol' in params and 'exchange' in params:
-            if hasattr(self.mappings, 'FIELD_MAP') and self.mappings.FIELD_MAP.get('symbol') == 'instrument_token':
+            if field_map.get('symbol') == 'instrument_token':
                 result['instrument_token'] = f"{params['exchange']}_{params['symbol']}"
                 if 'symbol' in result:
                     del result['symbol']  # Remove the original field
@@ -305,6 +352,28 @@ class MappingBasedTransformer(IParameterTransformer):
 # BROKER-SPECIFIC TRANSFORMER INSTANCES
 # =====================================================
 
+# Transformers and defaults are bound once at import; the order transformers
+# below only walk the incoming params on each call.
+_upstox_transform = MappingBasedTransformer(UpstoxMappings).transform
+_xts_transform = MappingBasedTransformer(XTSMappings).transform
+
+_UPSTOX_ORDER_DEFAULTS = {
+    'validity': 'DAY',
+    'price': 0,
+    'tag': '',
+    'disclosed_quantity': 0,
+    'trigger_price': 0,
+    'is_amo': False,
+}
+
+_XTS_ORDER_DEFAULTS = {
+    'exchangeInstrumentID': 0,
+    'timeInForce': 'DAY',
+    'disclosedQuantity': 0,
+    'limitPrice': 0,
+    'stopPrice': 0,
+}
+
 def upstox_order_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     🔄 Upstox Order Transformer - Now Following SOLID Principles!
@@ -317,32 +386,8 @@ def upstox_order_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
     - Can reuse transformation logic for other brokers
     - Easy to test and maintain
     """
-    transformer = MappingBasedTransformer(UpstoxMappings)
-    result = transformer.transform(params)
-
-    # Add default values specific to Upstox
-    result.setdefault('validity', 'DAY')
-    result.setdefault('price', 0)
-    result.setdefault('tag', '')
-    result.setdefault('disclosed_quantity', 0)
-    result.setdefault('trigger_price', 0)
-    result.setdefault('is_amo', False)
-
-    return result
-
-    return {
-        'quantity': params['quantity'],
-        'product': product_map.get(params['product_type'], 'I'),
-        'validity': params.get('validity', 'DAY'),
-        'price': params.get('price', 0),
-        'tag': params.get('tag', ''),
-        'instrument_token': f"{params['exchange']}_{params['symbol']}",
-        'order_type': order_type_map.get(params['order_type'], 'MARKET'),
-        'transaction_type': params['order_side'],
-        'disclosed_quantity': params.get('disclosed_quantity', 0),
-        'trigger_price': params.get('trigger_price', 0),
-        'is_amo': params.get('is_amo', False)
-    }
+    # Upstox defaults fill any field the transformed params leave out
+    return {**_UPSTOX_ORDER_DEFAULTS, **_upstox_transform(params)}
 
 
 def xts_order_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -357,17 +402,8 @@ def xts_order_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
     - Reuses the same transformation logic as Upstox
     - Adding new field mappings doesn't require code changes
     """
-    transformer = MappingBasedTransformer(XTSMappings)
-    result = transformer.transform(params)
-
-    # Add XTS-specific defaults
-    result.setdefault('exchangeInstrumentID', 0)
-    result.setdefault('timeInForce', 'DAY')
-    result.setdefault('disclosedQuantity', 0)
-    result.setdefault('limitPrice', 0)
-    result.setdefault('stopPrice', 0)
-
-    return result
+    # XTS-specific defaults fill any field the transformed params leave out
+    return {**_XTS_ORDER_DEFAULTS, **_xts_transform(params)}
 
 
 def upstox_quote_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -398,14 +434,22 @@ def upstox_quote_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     exchange = params.get('exchange', 'NSE')  # Default to NSE if not specified
 
-    # Add exchange prefix to each symbol (like adding store section)
-    instrument_keys = [f"{exchange}_{symbol}" for symbol in params['symbols']]
-
     return {
-        'instrument_key': ','.join(instrument_keys)  # Join with commas for Upstox
+        'instrument_key': _upstox_instrument_keys(exchange, tuple(params['symbols']))
     }
 
 
+@lru_cache(maxsize=256)
+def _upstox_instrument_keys(exchange: str, symbols: tuple[str, ...]) -> str:
+    """Build Upstox's comma-separated ``EXCHANGE_SYMBOL`` list in one join."""
+    if not symbols:
+        return ''
+    # Add exchange prefix to each symbol (like adding store section)
+    prefix = f'{exchange}_'
+    # str() keeps numeric symbols (e.g. BSE scrip codes) working as before
+    return prefix + (',' + prefix).join(map(str, symbols))
+
+
 def xts_quote_transformer(params: Dict[str, Any]) -> Dict[str, Any]:
     """Transform standard quote params to XTS format"""
     return {
@@ -477,7 +521,7 @@ class TransformerFactory:
             mappings_class: Mappings class for the broker
         """
         cls._transformers[broker_name] = mappings_class
-        print(f"✅ Registered new broker: {broker_name}")
+        logger.debug("Registered new broker: %s", broker_name)
 
     @classmethod
     def list_supported_brokers(cls) -> list[str]:
@@ -501,314 +545,214 @@ def create_xts_order_transformer() -> IParameterTransformer:
 # UPSTOX CONFIGURATION
 # =====================================================
 
-def configure_upstox_broker():
-    """Configure all Upstox endpoints"""
-    builder = BrokerConfigurationBuilder("upstox")
-
+UPSTOX_OPERATIONS: tuple[OperationConfig, ...] = (
     # Order Operations
-    builder.add_operation(
+    OperationConfig(
         OperationType.PLACE_ORDER,
         broker_endpoint="place_order",
         http_method="POST",
-        required_fields=['symbol', 'exchange', 'quantity', 'order_side', 'order_type', 'product_type'],
-        optional_fields=['price', 'trigger_price', 'validity', 'disclosed_quantity', 'tag', 'is_amo'],
+        required_fields=_ORDER_REQUIRED,
+        optional_fields=_ORDER_OPTIONAL,
         parameter_transformer=upstox_order_transformer,
-        requires_auth=True,
         cache_ttl=0
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.MODIFY_ORDER,
         broker_endpoint="modify_order",
         http_method="PUT",
-        required_fields=['order_id'],
-        optional_fields=['quantity', 'price', 'trigger_price', 'validity'],
-        requires_auth=True,
+        required_fields=_ORDER_ID_REQUIRED,
+        optional_fields=('quantity', 'price', 'trigger_price', 'validity'),
         cache_ttl=0
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.CANCEL_ORDER,
         broker_endpoint="cancel_order",
         http_method="DELETE",
-        required_fields=['order_id'],
-        requires_auth=True,
+        required_fields=_ORDER_ID_REQUIRED,
         cache_ttl=0
-    )
-
-    builder.add_operation(
-        OperationType.GET_ORDERS,
-        broker_endpoint="orders",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=5
-    )
+    ),
+    OperationConfig(OperationType.GET_ORDERS, broker_endpoint="orders", cache_ttl=5),
 
     # Portfolio Operations
-    builder.add_operation(
-        OperationType.GET_POSITIONS,
-        broker_endpoint="positions",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=10
-    )
-
-    builder.add_operation(
-        OperationType.GET_HOLDINGS,
-        broker_endpoint="holdings",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=30
-    )
+    OperationConfig(OperationType.GET_POSITIONS, broker_endpoint="positions", cache_ttl=10),
+    OperationConfig(OperationType.GET_HOLDINGS, broker_endpoint="holdings", cache_ttl=30),
 
     # Market Data Operations
-    builder.add_operation(
+    OperationConfig(
         OperationType.GET_QUOTES,
         broker_endpoint="quote",
-        http_method="GET",
-        required_fields=['symbols'],
-        optional_fields=['exchange'],
+        required_fields=_QUOTE_REQUIRED,
+        optional_fields=_EXCHANGE_OPTIONAL,
         parameter_transformer=upstox_quote_transformer,
-        requires_auth=True,
         cache_ttl=1
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.GET_MARKET_STATUS,
         broker_endpoint="market_status",
-        http_method="GET",
-        required_fields=[],
-        optional_fields=['segment'],
-        requires_auth=True,
+        optional_fields=('segment',),
         cache_ttl=60
-    )
+    ),
 
     # Historical Data
-    builder.add_operation(
+    OperationConfig(
         OperationType.GET_CANDLES,
         broker_endpoint="candles",
-        http_method="GET",
-        required_fields=['symbol', 'exchange', 'interval'],
-        optional_fields=['from_date', 'to_date', 'limit'],
-        requires_auth=True,
+        required_fields=('symbol', 'exchange', 'interval'),
+        optional_fields=('from_date', 'to_date', 'limit'),
         cache_ttl=300
-    )
+    ),
 
     # User Profile
-    builder.add_operation(
-        OperationType.GET_PROFILE,
-        broker_endpoint="profile",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=3600
-    )
+    OperationConfig(OperationType.GET_PROFILE, broker_endpoint="profile", cache_ttl=3600),
+    OperationConfig(OperationType.GET_FUNDS, broker_endpoint="funds", cache_ttl=10),
+)
 
-    builder.add_operation(
-        OperationType.GET_FUNDS,
-        broker_endpoint="funds",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=10
-    )
 
-    builder.build()
+def configure_upstox_broker():
+    """Configure all Upstox endpoints"""
+    BrokerConfigurationBuilder("upstox").add_operations(UPSTOX_OPERATIONS).build()
 
 
 # =====================================================
 # XTS CONFIGURATION
 # =====================================================
 
-def configure_xts_broker():
-    """Configure all XTS endpoints"""
-    builder = BrokerConfigurationBuilder("xts")
-
+XTS_OPERATIONS: tuple[OperationConfig, ...] = (
     # Order Operations
-    builder.add_operation(
+    OperationConfig(
         OperationType.PLACE_ORDER,
         broker_endpoint="order.place",
         http_method="POST",
-        required_fields=['symbol', 'exchange', 'quantity', 'order_side', 'order_type', 'product_type', 'instrument_id'],
-        optional_fields=['price', 'trigger_price', 'validity', 'disclosed_quantity'],
+        required_fields=_ORDER_REQUIRED + ('instrument_id',),
+        optional_fields=_ORDER_OPTIONAL[:4],
         parameter_transformer=xts_order_transformer,
-        requires_auth=True,
         cache_ttl=0
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.MODIFY_ORDER,
         broker_endpoint="order.modify",
         http_method="PUT",
-        required_fields=['order_id'],
-        requires_auth=True,
+        required_fields=_ORDER_ID_REQUIRED,
         cache_ttl=0
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.CANCEL_ORDER,
         broker_endpoint="order.cancel",
         http_method="DELETE",
-        required_fields=['order_id'],
-        requires_auth=True,
+        required_fields=_ORDER_ID_REQUIRED,
         cache_ttl=0
-    )
-
-    builder.add_operation(
-        OperationType.GET_ORDERS,
-        broker_endpoint="orders",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=5
-    )
-
-    builder.add_operation(
-        OperationType.GET_TRADES,
-        broker_endpoint="trades",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=5
-    )
+    ),
+    OperationConfig(OperationType.GET_ORDERS, broker_endpoint="orders", cache_ttl=5),
+    OperationConfig(OperationType.GET_TRADES, broker_endpoint="trades", cache_ttl=5),
 
     # Portfolio Operations
-    builder.add_operation(
-        OperationType.GET_POSITIONS,
-        broker_endpoint="portfolio.positions",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=10
-    )
-
-    builder.add_operation(
-        OperationType.GET_HOLDINGS,
-        broker_endpoint="portfolio.holdings",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=30
-    )
+    OperationConfig(OperationType.GET_POSITIONS, broker_endpoint="portfolio.positions", cache_ttl=10),
+    OperationConfig(OperationType.GET_HOLDINGS, broker_endpoint="portfolio.holdings", cache_ttl=30),
 
     # Market Data Operations
-    builder.add_operation(
+    OperationConfig(
         OperationType.GET_QUOTES,
         broker_endpoint="market.instruments.quotes",
-        http_method="GET",
-        required_fields=['instruments'],
-        optional_fields=['message_code'],
+        required_fields=('instruments',),
+        optional_fields=('message_code',),
         parameter_transformer=xts_quote_transformer,
-        requires_auth=True,
         cache_ttl=1
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.SEARCH_INSTRUMENTS,
         broker_endpoint="market.search.instrumentsbystring",
-        http_method="GET",
-        required_fields=['search_string'],
-        requires_auth=True,
+        required_fields=('search_string',),
         cache_ttl=300
-    )
+    ),
 
     # User Operations
-    builder.add_operation(
-        OperationType.GET_PROFILE,
-        broker_endpoint="user.profile",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=3600
-    )
+    OperationConfig(OperationType.GET_PROFILE, broker_endpoint="user.profile", cache_ttl=3600),
+    OperationConfig(OperationType.GET_FUNDS, broker_endpoint="user.balance", cache_ttl=60),
+)
 
-    builder.add_operation(
-        OperationType.GET_FUNDS,
-        broker_endpoint="user.balance",
-        http_method="GET",
-        required_fields=[],
-        requires_auth=True,
-        cache_ttl=60
-    )
 
-    builder.build()
+def configure_xts_broker():
+    """Configure all XTS endpoints"""
+    BrokerConfigurationBuilder("xts").add_operations(XTS_OPERATIONS).build()
 
 
 # =====================================================
 # GROWW CONFIGURATION
 # =====================================================
 
-def configure_groww_broker():
-    """Configure all Groww endpoints"""
-    builder = BrokerConfigurationBuilder("groww")
-
+GROWW_OPERATIONS: tuple[OperationConfig, ...] = (
     # Market Data Operations (Groww is primarily market data)
-    builder.add_operation(
+    OperationConfig(
         OperationType.GET_QUOTES,
         broker_endpoint="live_aggregated",
         http_method="POST",
-        required_fields=['symbols'],
-        optional_fields=['exchange'],
+        required_fields=_QUOTE_REQUIRED,
+        optional_fields=_EXCHANGE_OPTIONAL,
         requires_auth=False,
         cache_ttl=5
-    )
-
-    builder.add_operation(
+    ),
+    OperationConfig(
         OperationType.GET_INDICES,
         broker_endpoint="nifty_data",
-        http_method="GET",
-        required_fields=[],
-        optional_fields=['index_name'],
+        optional_fields=('index_name',),
         requires_auth=False,
         cache_ttl=60
-    )
+    ),
+)
 
-    builder.build()
+
+def configure_groww_broker():
+    """Configure all Groww endpoints"""
+    BrokerConfigurationBuilder("groww").add_operations(GROWW_OPERATIONS).build()
 
 
 # =====================================================
 # REGISTER ALL PARAMETER SCHEMAS
 # =====================================================
 
+# Built once at import; registering them again is a no-op
+_ORDER_SCHEMA = ParameterSchema(
+    operation=OperationType.PLACE_ORDER,
+    category=EndpointCategory.ORDERS,
+    required_fields=_ORDER_REQUIRED,
+    optional_fields=_ORDER_OPTIONAL,
+    validation_rules=[validate_order_params],
+    description="Standard order placement parameters"
+)
+
+_QUOTE_SCHEMA = ParameterSchema(
+    operation=OperationType.GET_QUOTES,
+    category=EndpointCategory.MARKET_DATA,
+    required_fields=_QUOTE_REQUIRED,
+    optional_fields=_EXCHANGE_OPTIONAL + ('message_code',),
+    validation_rules=[validate_quote_params],
+    description="Standard quote retrieval parameters"
+)
+
+_POSITION_SCHEMA = ParameterSchema(
+    operation=OperationType.GET_POSITIONS,
+    category=EndpointCategory.PORTFOLIO,
+    required_fields=_EMPTY,
+    optional_fields=('account_id',),
+    description="Standard position retrieval parameters"
+)
+
+# Add more schemas as needed...
+_GLOBAL_SCHEMAS = (_ORDER_SCHEMA, _QUOTE_SCHEMA, _POSITION_SCHEMA)
+
+
 def register_global_schemas():
-    """Register global parameter schemas with validation"""
-
-    # Order schema
-    order_schema = ParameterSchema(
-        operation=OperationType.PLACE_ORDER,
-        category=EndpointCategory.ORDERS,
-        required_fields=['symbol', 'exchange', 'quantity', 'order_side', 'order_type', 'product_type'],
-        optional_fields=['price', 'trigger_price', 'validity', 'disclosed_quantity', 'tag', 'is_amo'],
-        validation_rules=[validate_order_params],
-        description="Standard order placement parameters"
-    )
-    ParameterSchemaRegistry.register_schema(order_schema)
-
-    # Quote schema
-    quote_schema = ParameterSchema(
-        operation=OperationType.GET_QUOTES,
-        category=EndpointCategory.MARKET_DATA,
-        required_fields=['symbols'],
-        optional_fields=['exchange', 'message_code'],
-        validation_rules=[validate_quote_params],
-        description="Standard quote retrieval parameters"
-    )
-    ParameterSchemaRegistry.register_schema(quote_schema)
-
-    # Position schema
-    position_schema = ParameterSchema(
-        operation=OperationType.GET_POSITIONS,
-        category=EndpointCategory.PORTFOLIO,
-        required_fields=[],
-        optional_fields=['account_id'],
-        description="Standard position retrieval parameters"
-    )
-    ParameterSchemaRegistry.register_schema(position_schema)
+    """
+    Register global parameter schemas with validation
 
-    # Add more schemas as needed...
+    Only operations that have no schema yet are registered, so a schema a
+    caller registered for an operation is never replaced, and repeated
+    calls (one per lazily configured broker) cost a few dict lookups.
+    """
+    get_schema = ParameterSchemaRegistry.get_schema
+    ParameterSchemaRegistry.register_schemas(
+        schema for schema in _GLOBAL_SCHEMAS if get_schema(schema.operation) is None
+    )
 
 
 # =====================================================
@@ -832,6 +776,9 @@ class BrokerConfigurationRegistry:
 
     _configurations = {}
 
+    # Brokers whose configuration already ran in this process
+    _configured: ClassVar[set[str]] = set()
+
     @classmethod
     def register_configuration(cls, broker_name: str, config_func: Callable[[], None]):
         """
@@ -842,26 +789,55 @@ class BrokerConfigurationRegistry:
             config_func: Function that configures the broker
         """
         cls._configurations[broker_name] = config_func
-        print(f"✅ Registered configuration for: {broker_name}")
+        cls._configured.discard(broker_name)  # A new function must run again
+        BrokerMappingRegistry.register_loader(
+            broker_name, lambda: cls.ensure_configured(broker_name)
+        )
+        logger.debug("Registered configuration for: %s", broker_name)
 
     @classmethod
     def configure_broker(cls, broker_name: str):
-        """Configure a specific broker"""
+        """Configure a specific broker (runs at most once until reset)"""
         if broker_name not in cls._configurations:
             available = ', '.join(cls._configurations.keys())
             raise ValueError(f"No configuration found for: {broker_name}. Available: {available}")
 
+        if broker_name in cls._configured:
+            return
+
         cls._configurations[broker_name]()
+        cls._configured.add(broker_name)
+
+    @classmethod
+    def ensure_configured(cls, broker_name: str):
+        """
+        Lazily configure a broker the first time it is used
+
+        Unknown brokers are ignored so services without a registered
+        configuration (e.g. custom APIs) can still be created.
+        """
+        if broker_name in cls._configured or broker_name not in cls._configurations:
+            return
+        register_global_schemas()
+        cls.configure_broker(broker_name)
 
     @classmethod
     def configure_all_brokers(cls):
-        """Configure all registered brokers"""
+        """Configure all registered brokers, skipping ones already configured"""
         for broker_name, config_func in cls._configurations.items():
+            if broker_name in cls._configured:
+                continue
             try:
                 config_func()
-                print(f"✅ {broker_name.title()} configuration loaded")
+                cls._configured.add(broker_name)
+                logger.info("✅ %s configuration loaded", broker_name)
             except Exception as e:
-                print(f"❌ Failed to configure {broker_name}: {e}")
+                logger.error("❌ Failed to configure %s: %s", broker_name, e)
+
+    @classmethod
+    def reset(cls):
+        """Forget which brokers were configured so the next call re-runs them"""
+        cls._configured.clear()
 
     @classmethod
     def list_registered_brokers(cls) -> list[str]:
@@ -881,6 +857,10 @@ def initialize_scalable_architecture():
     """
     🏗️ Initialize the Complete Scalable Architecture
 
+    Brokers are configured lazily on first use (see
+    BrokerConfigurationRegistry.ensure_configured), so calling this is
+    optional - it warms every registered broker up front.
+
     Now following SOLID principles:
     - Single Responsibility: Each component has one job
     - Open/Closed: Easy to extend without modifying existing code
@@ -888,28 +868,30 @@ def initialize_scalable_architecture():
     - Interface Segregation: Clean, focused interfaces
     - Dependency Inversion: Depends on abstractions, not concretions
     """
-    print("🏗️ Initializing Scalable Trading Architecture...")
+    logger.info("🏗️ Initializing Scalable Trading Architecture...")
 
     # Register global schemas
     register_global_schemas()
-    print("✅ Global parameter schemas registered")
+    logger.info("✅ Global parameter schemas registered")
 
     # Configure all brokers using registry (SOLID approach!)
     BrokerConfigurationRegistry.configure_all_brokers()
 
-    # Print summary
-    from .scalable_architecture import (BrokerMappingRegistry,
-                                        ParameterSchemaRegistry)
-
-    print("\n📊 Architecture Summary:")
-    print(f"   Registered Brokers: {len(BrokerMappingRegistry.list_brokers())}")
-    print(f"   Registered Operations: {len(ParameterSchemaRegistry.list_operations())}")
-
-    for broker in BrokerMappingRegistry.list_brokers():
-        operations = BrokerMappingRegistry.get_supported_operations(broker)
-        print(f"   {broker.title()}: {len(operations)} operations")
-
-    print("\n🚀 Scalable architecture ready!")
+    # Summary is only assembled when someone is listening, and emitted
+    # as one record so it reaches the handler in a single write
+    if logger.isEnabledFor(logging.INFO):
+        brokers = BrokerMappingRegistry.list_brokers()
+        lines = [
+            "📊 Architecture Summary:",
+            f"   Registered Brokers: {len(brokers)}",
+            f"   Registered Operations: {len(ParameterSchemaRegistry.list_operations())}",
+        ]
+        for broker in brokers:
+            operations = BrokerMappingRegistry.get_supported_operations(broker)
+            lines.append(f"   {broker.title()}: {len(operations)} operations")
+        logger.info("\n".join(lines))
+
+    logger.info("🚀 Scalable architecture ready!")
 
 
 if __name__ == "__main__":
@@ -4,12 +4,69 @@ Custom API Service Implementation
 This service allows you to create a service for any API on the fly with custom endpoints.
 """
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict
 
 from .base_service import BaseTradingService
 from .models import EndpointConfig
 
 
+# Accepted types of each optional endpoint field ("path" must be a non-empty str)
+_ENDPOINT_FIELD_TYPES = {
+    "method": (str,),
+    "cache_ttl": (int, float),
+    "use_cache": (bool, int),  # 0/1 flags are accepted as before
+    "description": (str,),
+}
+
+# config["auth"]["type"] -> builder of the matching _apply_auth spec
+_AUTH_TYPE_SPECS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "bearer": lambda auth: {"bearer": auth.get("token")},
+    "api_key": lambda auth: {"api_key": (auth.get("header_name", "X-API-Key"), auth.get("key"))},
+    "basic": lambda auth: {"basic": (auth.get("username"), auth.get("password"))},
+    "custom": lambda auth: {"header": auth.get("headers", {})},
+}
+
+
+def _validate_endpoints(endpoints: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Validate every endpoint definition up front
+
+    Raises:
+        ValueError: If an endpoint is not a dict, its path is missing or not a
+            non-empty string, or a known field has the wrong type
+    """
+    if not isinstance(endpoints, dict):
+        raise ValueError("endpoints must be a dict of name -> endpoint config")
+
+    for name, config in endpoints.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"Endpoint '{name}' config must be a dict")
+        path = config.get("path")
+        if not path or not isinstance(path, str):
+            raise ValueError(f"Endpoint '{name}' needs a non-empty string 'path'")
+        for field_name, expected in _ENDPOINT_FIELD_TYPES.items():
+            value = config.get(field_name)
+            if value is not None and not isinstance(value, expected):
+                raise ValueError(
+                    f"Endpoint '{name}' field '{field_name}' must be "
+                    f"{' or '.join(kind.__name__ for kind in expected)}, got {type(value).__name__}"
+                )
+
+
+@lru_cache(maxsize=512)
+def _endpoint_config(path: str, method: str, cache_ttl: int,
+                     use_cache: bool, description: str) -> EndpointConfig:
+    """Return a shared EndpointConfig for identical endpoint definitions"""
+    return EndpointConfig(
+        path=path,
+        method=method,
+        cache_ttl=cache_ttl,
+        use_cache=use_cache,
+        description=description
+    )
+
+
 class CustomAPIService(BaseTradingService):
     """
     CustomAPIService allows you to create a service for any API on the fly.
@@ -30,6 +87,7 @@ class CustomAPIService(BaseTradingService):
     **Endpoint Usage:**
     - Endpoints are defined as a dict of name -> config dict
     - Each config dict can have: path, method, cache_ttl, use_cache, description
+    - path is required; malformed definitions raise ValueError at construction
     - Path parameters are substituted using path_params in call_endpoint
 
     **Example:**
@@ -53,7 +111,8 @@ class CustomAPIService(BaseTradingService):
 
     **Notes:**
     - All endpoint configs support path parameter substitution.
-    - You can add or modify endpoints at runtime via `self.custom_endpoints`.
+    - You can add or replace endpoints at runtime via `self.custom_endpoints`;
+      EndpointConfig objects are frozen and may be shared between instances.
     - See BaseTradingService for more details on kwargs and usage.
     """
 
@@ -65,18 +124,23 @@ class CustomAPIService(BaseTradingService):
             base_url: The base URL for your API
             endpoints: Dictionary of endpoint configurations
             **kwargs: Additional client parameters
+
+        Raises:
+            ValueError: If an endpoint definition is malformed
         """
+        _validate_endpoints(endpoints)
+
         self.custom_base_url = base_url
         self.custom_endpoints = {}
 
-        # Convert endpoint configs to EndpointConfig objects
+        # Convert endpoint configs to (shared, immutable) EndpointConfig objects
         for name, config in endpoints.items():
-            self.custom_endpoints[name] = EndpointConfig(
-                path=config.get("path", ""),
-                method=config.get("method", "GET"),
-                cache_ttl=config.get("cache_ttl", 30),
-                use_cache=config.get("use_cache", True),
-                description=config.get("description", f"Custom endpoint: {name}")
+            self.custom_endpoints[name] = _endpoint_config(
+                config.get("path", ""),
+                config.get("method", "GET"),
+                config.get("cache_ttl", 30),
+                config.get("use_cache", True),
+                config.get("description", f"Custom endpoint: {name}")
             )
 
         super().__init__(**kwargs)
@@ -106,29 +170,13 @@ class CustomAPIService(BaseTradingService):
         """Apply flexible authentication based on config."""
         auth_config = self.config.get("auth", {})
 
-        # Support different auth types
-        auth_type = auth_config.get("type", "none")
-
-        if auth_type == "bearer":
-            token = auth_config.get("token")
-            self._add_bearer_token(headers, token)
-
-        elif auth_type == "api_key":
-            key = auth_config.get("key")
-            header_name = auth_config.get("header_name", "X-API-Key")
-            self._add_api_key_header(headers, key, header_name)
-
-        elif auth_type == "basic":
-            username = auth_config.get("username")
-            password = auth_config.get("password")
-            self._add_basic_auth(headers, username, password)
-
-        elif auth_type == "custom":
-            custom_headers = auth_config.get("headers", {})
-            self._add_custom_auth(headers, custom_headers)
+        # Support different auth types ("none" and unknown types add nothing)
+        build_spec = _AUTH_TYPE_SPECS.get(auth_config.get("type", "none"))
+        if build_spec is not None:
+            self._apply_auth(headers, build_spec(auth_config))
 
         # Also support direct auth config (backwards compatibility)
-        if "access_token" in self.config:
-            self._add_bearer_token(headers, self.config["access_token"])
-        if "api_key" in self.config:
-            self._add_api_key_header(headers, self.config["api_key"])
+        self._apply_auth(headers, {
+            "bearer": self.config.get("access_token"),
+            "api_key": ("X-API-Key", self.config.get("api_key")),
+        })
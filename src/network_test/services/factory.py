@@ -5,15 +5,28 @@ This module provides a factory for creating trading service instances.
 The factory supports different service types and configurations.
 """
 
-from typing import Any, Dict, Optional, Type, cast
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Type
 
-from .base_service import BaseTradingService
+from .broker_configurations import BrokerConfigurationRegistry
 from .custom_service import CustomAPIService
 from .groww_service import GrowwService
 from .interface import ITradingService
 from .upstox_service import UpstoxService
 from .xts_service import XTSService
 
+# Human-readable descriptions for the built-in service types
+_SERVICE_DESCRIPTIONS: Dict[str, str] = {
+    "upstox": "Upstox trading platform integration",
+    "groww": "Groww trading platform integration",
+    "custom": "Generic REST API service for custom endpoints",
+    "xts": "XTS (Symphony Fintech) trading platform integration",
+}
+
+
+# Arguments CustomAPIService takes explicitly rather than via **kwargs
+_CUSTOM_RESERVED = frozenset(("base_url", "endpoints"))
+
 
 class ServiceFactory:
     """
@@ -54,6 +67,14 @@ class ServiceFactory:
         "xts": XTSService,
     }
 
+    # Snapshot of registry keys for lookups and error messages,
+    # rebuilt whenever register_service changes the registry
+    _SERVICE_KEYS: frozenset[str] = frozenset(_SERVICE_REGISTRY)
+    _SERVICE_KEYS_STR: str = ", ".join(sorted(_SERVICE_REGISTRY))
+
+    # Read-only get_available_services() result, dropped on registration
+    _AVAILABLE_CACHE: Optional[Mapping[str, str]] = None
+
     @classmethod
     def create_service(cls,
                       service_type: str,
@@ -85,13 +106,15 @@ class ServiceFactory:
                 endpoints={"test": {"path": "/test", "method": "GET"}}
             )
         """
-        if service_type not in cls._SERVICE_REGISTRY:
-            available = list(cls._SERVICE_REGISTRY.keys())
+        if service_type not in cls._SERVICE_KEYS:
             raise ValueError(f"Unsupported service type: {service_type}. "
-                           f"Available types: {available}")
+                           f"Available types: {cls._SERVICE_KEYS_STR}")
 
         service_class = cls._SERVICE_REGISTRY[service_type]
 
+        # Only the requested broker's endpoint mappings are built
+        BrokerConfigurationRegistry.ensure_configured(service_type)
+
         # Special handling for CustomAPIService which requires specific parameters
         if service_type == "custom":
             base_url = kwargs.get("base_url")
@@ -102,41 +125,34 @@ class ServiceFactory:
             if not endpoints:
                 raise TypeError("CustomAPIService requires 'endpoints' parameter")
 
-            # Remove these from kwargs since they're handled specially
-            custom_kwargs = kwargs.copy()
-            custom_kwargs.pop("base_url", None)
-            custom_kwargs.pop("endpoints", None)
+            # Everything else is forwarded as client configuration
+            custom_kwargs = {k: v for k, v in kwargs.items() if k not in _CUSTOM_RESERVED}
 
-            # Cast to CustomAPIService to satisfy type checker
-            custom_service_class = cast(Type[CustomAPIService], service_class)
-            return custom_service_class(
+            # Registered under "custom", so this is CustomAPIService
+            return service_class(  # type: ignore[call-arg]
                 base_url=base_url,
                 endpoints=endpoints,
                 **custom_kwargs
             )
         else:
-            # For other services, pass config and kwargs to constructor
-            # Cast to BaseTradingService to satisfy type checker
-            base_service_class = cast(Type[BaseTradingService], service_class)
-            return base_service_class(config=config, **kwargs)
+            # For other services (BaseTradingService subclasses),
+            # pass config and kwargs to constructor
+            return service_class(config=config, **kwargs)  # type: ignore[call-arg]
 
     @classmethod
-    def get_available_services(cls) -> Dict[str, str]:
+    def get_available_services(cls) -> Mapping[str, str]:
         """
-        Get a dictionary of available service types and their descriptions.
+        Get a mapping of available service types and their descriptions.
 
         Returns:
-            Dictionary mapping service type to description
+            Read-only mapping of service type to description
         """
-        descriptions = {
-            "upstox": "Upstox trading platform integration",
-            "groww": "Groww trading platform integration",
-            "custom": "Generic REST API service for custom endpoints",
-            "xts": "XTS (Symphony Fintech) trading platform integration",
-        }
-
-        return {service_type: descriptions.get(service_type, "Trading service")
-                for service_type in cls._SERVICE_REGISTRY.keys()}
+        if cls._AVAILABLE_CACHE is None:
+            cls._AVAILABLE_CACHE = MappingProxyType({
+                service_type: _SERVICE_DESCRIPTIONS.get(service_type, "Trading service")
+                for service_type in cls._SERVICE_REGISTRY.keys()
+            })
+        return cls._AVAILABLE_CACHE
 
     @classmethod
     def register_service(cls, service_type: str, service_class: Type[ITradingService]) -> None:
@@ -152,10 +168,16 @@ class ServiceFactory:
         Raises:
             TypeError: If service_class doesn't implement ITradingService
         """
+        if cls._SERVICE_REGISTRY.get(service_type) is service_class:
+            return  # Re-registering the same class is a no-op
+
         if not issubclass(service_class, ITradingService):
             raise TypeError("Service class must implement ITradingService interface")
 
         cls._SERVICE_REGISTRY[service_type] = service_class
+        cls._SERVICE_KEYS = frozenset(cls._SERVICE_REGISTRY)
+        cls._SERVICE_KEYS_STR = ", ".join(sorted(cls._SERVICE_REGISTRY))
+        cls._AVAILABLE_CACHE = None
 
     @classmethod
     def is_service_available(cls, service_type: str) -> bool:
@@ -168,4 +190,4 @@ class ServiceFactory:
         Returns:
             True if service type is available, False otherwise
         """
-        return service_type in cls._SERVICE_REGISTRY
+        return service_type in cls._SERVICE_KEYS
@@ -5,12 +5,27 @@ This service provides access to Groww API endpoints for market data with proper
 authentication, rate limiting, caching, and error handling.
 """
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-from ..config import GROWW_CONFIG
 from .base_service import BaseTradingService
 from .models import EndpointConfig
 
+_DEFAULT_BASE_URL = 'https://groww.in/'
+
+try:
+    from ..config import GROWW_CONFIG as _GROWW_CONFIG
+except ImportError:
+    # Fallback to minimal config if config.py doesn't provide one
+    _GROWW_CONFIG = {
+        'base_url': _DEFAULT_BASE_URL,
+        'rate_limit': 50,
+        'timeout': 5
+    }
+
+# Resolved once at import; BaseTradingService copies it per instance
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(dict(_GROWW_CONFIG))
+
 
 class GrowwService(BaseTradingService):
     """
@@ -20,7 +35,9 @@ class GrowwService(BaseTradingService):
     rate limiting, caching, and error handling.
     """
 
-    _ENDPOINTS = {
+    # Shared, read-only endpoint table; config-supplied endpoints are
+    # overlaid on a per-instance copy (see _load_custom_endpoints)
+    _ENDPOINTS: Mapping[str, EndpointConfig] = MappingProxyType({
         "nifty_data": EndpointConfig(
             path="v1/api/stocks_data/v1/accord_points/exchange/NSE/segment/CASH/latest_indices_ohlc/{index_name}",
             method="GET",
@@ -33,48 +50,44 @@ class GrowwService(BaseTradingService):
             cache_ttl=5,
             description="Get live aggregated market data"
         ),
-    }
+    })
 
-    def get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration for Groww service."""
-        try:
-            return GROWW_CONFIG
-        except (ImportError, NameError):
-            # Fallback to minimal config if config.py doesn't exist
-            return {
-                'base_url': 'https://groww.in/',
-                'rate_limit': 50,
-                'timeout': 5
-            }
+    def get_default_config(self) -> Mapping[str, Any]:
+        """Get default configuration for Groww service (read-only)."""
+        return _DEFAULT_CONFIG
 
     def get_default_base_url(self) -> str:
         """Get default base URL for Groww API."""
-        return 'https://groww.in/'
+        return _DEFAULT_BASE_URL
 
-    def get_service_endpoints(self) -> Dict[str, EndpointConfig]:
+    def get_service_endpoints(self) -> Mapping[str, EndpointConfig]:
         """Get service-specific endpoint configurations."""
         return self._ENDPOINTS
 
+    def _load_custom_endpoints(self, endpoints_config: Dict[str, Any]) -> None:
+        """Load config endpoints into this instance's own copy of the table."""
+        self._ENDPOINTS = dict(self._ENDPOINTS)
+        super()._load_custom_endpoints(endpoints_config)
+
     def get_service_name(self) -> str:
         """Return the service name identifier"""
         return "groww"
 
     def _apply_authentication(self, headers: Dict[str, str]) -> None:
-        """Apply Groww-specific authentication."""
+        """Apply Groww-specific authentication with a single header merge."""
+        config = self.config
         # Groww typically uses session-based auth or custom headers
-        session_token = self.config.get("session_token")
-        user_agent = self.config.get("user_agent")
-
-        if session_token:
-            headers["X-Session-Token"] = session_token
-
-        # Groww might require specific user agents or cookies
-        if user_agent:
-            headers["User-Agent"] = user_agent
-
-        # Add any custom auth headers from config
-        auth_headers = self.config.get("auth_headers", {})
-        self._add_custom_auth(headers, auth_headers)
+        auth_headers = {
+            "X-Session-Token": config.get("session_token"),
+            # Groww might require specific user agents or cookies
+            "User-Agent": config.get("user_agent"),
+        }
+
+        # Custom auth headers from config take precedence when set
+        auth_headers.update(
+            (name, value) for name, value in config.get("auth_headers", {}).items() if value
+        )
+        self._apply_auth(headers, {"header": auth_headers})
 
     # Convenient methods for common operations (specific to Groww)
     async def get_nifty_data(self, index_name: str = "BANKNIFTY"):
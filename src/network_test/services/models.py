@@ -2,31 +2,90 @@
 Common models and configurations for trading services.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Any, Dict, Optional, Tuple
 
+# (literal text, placeholder name or None) pairs making up an endpoint path
+PathSegments = Tuple[Tuple[str, Optional[str]], ...]
 
-@dataclass
+
+def _compile_path(path: str) -> Optional[PathSegments]:
+    """
+    Split a path template into literal/placeholder segments.
+
+    Returns an empty tuple for paths without braces, and None when the
+    template needs full str.format handling (format specs, conversions,
+    attribute/index lookups or malformed braces).
+    """
+    if "{" not in path and "}" not in path:
+        return ()
+    segments = []
+    try:
+        for literal, field_name, format_spec, conversion in Formatter().parse(path):
+            if field_name is not None and (
+                format_spec or conversion or not field_name.isidentifier()
+            ):
+                return None
+            segments.append((literal, field_name))
+    except ValueError:
+        return None
+    return tuple(segments)
+
+
+@dataclass(frozen=True, slots=True)
 class EndpointConfig:
-    """Configuration for a specific API endpoint"""
+    """
+    Configuration for a specific API endpoint
+
+    Instances are immutable so one config can be shared by every service
+    instance that declares the same endpoint.
+    """
     path: str
     method: str = "GET"
     cache_ttl: int = 30
     use_cache: bool = True
     description: str = ""
+    # Fixed per-endpoint request arguments, built once and copied per call
+    request_template: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    # Path template parsed once so formatting is a join over known segments
+    _path_segments: Optional[PathSegments] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "request_template", {
+            "method": self.method,
+            "use_cache": self.use_cache,
+            "cache_ttl": self.cache_ttl,
+        })
+        object.__setattr__(self, "_path_segments", _compile_path(self.path))
+
+    def format_path(self, path_params: Dict[str, Any]) -> str:
+        """Substitute path parameters, equivalent to path.format(**path_params)"""
+        segments = self._path_segments
+        if segments is None:
+            return self.path.format(**path_params)
+        if not segments:
+            return self.path
+        # A list (not a generator) lets join size the result in one pass
+        return "".join([
+            literal if name is None else literal + str(path_params[name])
+            for literal, name in segments
+        ])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NetworkClientConfig:
-    """Configuration for AsyncNetworkClient parameters"""
+    """Configuration for AsyncNetworkClient parameters (immutable once built)"""
     base_url: str
     rate_limit: int = 25
     timeout: int = 10
-    max_connections: int = 20
+    max_connections: int = 100
     max_retries: int = 3
     cache_ttl: int = 30
     enable_circuit_breaker: bool = True
     default_headers: Optional[Dict[str, str]] = None
+    keepalive_expiry: int = 30
+    cache_max_entries: int = 1024
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for AsyncNetworkClient initialization"""
@@ -38,5 +97,7 @@ class NetworkClientConfig:
             "max_retries": self.max_retries,
             "cache_ttl": self.cache_ttl,
             "enable_circuit_breaker": self.enable_circuit_breaker,
-            "default_headers": self.default_headers or {}
+            "default_headers": self.default_headers or {},
+            "keepalive_timeout": self.keepalive_expiry,
+            "cache_max_entries": self.cache_max_entries
         }
@@ -6,19 +6,22 @@ mappers to handle different parameter formats across various trading services.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import Any, Optional, Union
 
 
-class OrderSide(Enum):
+# The order enums are StrEnums: each member *is* its string value, so it can
+# be compared with or sent as a plain string without going through .value
+
+class OrderSide(StrEnum):
     """Standardized order side values"""
     BUY = "BUY"
     SELL = "SELL"
 
 
-class OrderType(Enum):
+class OrderType(StrEnum):
     """Standardized order type values"""
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -26,21 +29,21 @@ class OrderType(Enum):
     STOP_LOSS_MARKET = "STOP_LOSS_MARKET"
 
 
-class ProductType(Enum):
+class ProductType(StrEnum):
     """Standardized product type values"""
     INTRADAY = "INTRADAY"  # MIS/I
     DELIVERY = "DELIVERY"  # CNC/D
     MARGIN = "MARGIN"      # NRML/M
 
 
-class Validity(Enum):
+class Validity(StrEnum):
     """Standardized order validity values"""
     DAY = "DAY"
     IOC = "IOC"  # Immediate or Cancel
     GTD = "GTD"  # Good Till Date
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardOrderParams:
     """
     Standardized order parameters that work across all brokers.
@@ -57,8 +60,8 @@ class StandardOrderParams:
     product_type: ProductType               # INTRADAY, DELIVERY, MARGIN
 
     # Optional parameters
-    price: Optional[Union[float, Decimal]] = None        # Limit price
-    trigger_price: Optional[Union[float, Decimal]] = None # Stop loss trigger price
+    price: Optional[Union[float, Decimal]] = None        # Limit price (stored as Decimal)
+    trigger_price: Optional[Union[float, Decimal]] = None # Stop loss trigger price (stored as Decimal)
     disclosed_quantity: int = 0                          # Iceberg quantity
     validity: Validity = Validity.DAY                    # Order validity
     tag: Optional[str] = None                           # Order tag/reference
@@ -70,18 +73,37 @@ class StandardOrderParams:
     # Broker-specific extras (will be ed through)
     extras: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Prices are held as Decimal; floats are converted once, here, via
+        # str() so 2500.1 stays 2500.1 rather than its binary expansion
+        if self.price is not None and not isinstance(self.price, Decimal):
+            self.price = Decimal(str(self.price))
+        if self.trigger_price is not None and not isinstance(self.trigger_price, Decimal):
+            self.trigger_price = Decimal(str(self.trigger_price))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, handling enums appropriately"""
-        result = {}
-        for key, value in asdict(self).items():
-            if isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
-        return result
+        # The enum fields are StrEnums (or plain strings), so they go in as-is
+        return {
+            "symbol": self.symbol,
+            "exchange": self.exchange,
+            "quantity": self.quantity,
+            "order_side": self.order_side,
+            "order_type": self.order_type,
+            "product_type": self.product_type,
+            # Prices leave as floats so the dict stays JSON-serializable
+            "price": None if self.price is None else float(self.price),
+            "trigger_price": None if self.trigger_price is None else float(self.trigger_price),
+            "disclosed_quantity": self.disclosed_quantity,
+            "validity": self.validity,
+            "tag": self.tag,
+            "is_amo": self.is_amo,
+            "variety": self.variety,
+            "extras": dict(self.extras),  # Don't hand out our own extras dict
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardQuoteParams:
     """Standardized quote parameters"""
     symbols: list[str]                      # List of symbols to get quotes for
@@ -89,7 +111,7 @@ class StandardQuoteParams:
     extras: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardHistoricalParams:
     """Standardized historical data parameters"""
     symbol: str                             # Trading symbol
@@ -130,77 +152,114 @@ class IParameterMapper(ABC):
 
 
 
-class UpstoxParameterMapper(IParameterMapper):
-    """Parameter mapper for Upstox broker"""
+# Enum -> broker string tables, kept at module level so the per-order
+# mapping reads them as globals instead of through the instance
 
-    # Upstox-specific mappings
-    ORDER_SIDE_MAP = {
-        OrderSide.BUY: "BUY",
-        OrderSide.SELL: "SELL"
-    }
+# Same strings for every broker
+_ORDER_SIDE_NAMES = {
+    OrderSide.BUY: "BUY",
+    OrderSide.SELL: "SELL"
+}
 
-    ORDER_TYPE_MAP = {
-        OrderType.MARKET: "MARKET",
-        OrderType.LIMIT: "LIMIT",
-        OrderType.STOP_LOSS: "SL",
-        OrderType.STOP_LOSS_MARKET: "SL-M"
-    }
+_VALIDITY_NAMES = {
+    Validity.DAY: "DAY",
+    Validity.IOC: "IOC",
+    Validity.GTD: "GTD"
+}
 
-    PRODUCT_TYPE_MAP = {
-        ProductType.INTRADAY: "I",
-        ProductType.DELIVERY: "D",
-        ProductType.MARGIN: "M"
-    }
+_UPSTOX_ORDER_TYPES = {
+    OrderType.MARKET: "MARKET",
+    OrderType.LIMIT: "LIMIT",
+    OrderType.STOP_LOSS: "SL",
+    OrderType.STOP_LOSS_MARKET: "SL-M"
+}
 
-    VALIDITY_MAP = {
-        Validity.DAY: "DAY",
-        Validity.IOC: "IOC",
-        Validity.GTD: "GTD"
-    }
+_UPSTOX_PRODUCT_TYPES = {
+    ProductType.INTRADAY: "I",
+    ProductType.DELIVERY: "D",
+    ProductType.MARGIN: "M"
+}
+
+_XTS_ORDER_TYPES = {
+    OrderType.MARKET: "MARKET",
+    OrderType.LIMIT: "LIMIT",
+    OrderType.STOP_LOSS: "STOPLOSS",
+    OrderType.STOP_LOSS_MARKET: "STOPMARKET"
+}
+
+_XTS_PRODUCT_TYPES = {
+    ProductType.INTRADAY: "MIS",
+    ProductType.DELIVERY: "CNC",
+    ProductType.MARGIN: "NRML"
+}
+
+_XTS_EXCHANGE_SEGMENTS = {
+    "NSE": "NSECM",
+    "BSE": "BSECM",
+    "NFO": "NSEFO",
+    "BFO": "BSEFO"
+}
+
+# Extras consumed explicitly by XTSParameterMapper.map_quote_params
+_XTS_QUOTE_RESERVED = frozenset(("instruments", "xtsMessageCode"))
+
+
+class UpstoxParameterMapper(IParameterMapper):
+    """Parameter mapper for Upstox broker"""
+
+    # Upstox-specific mappings
+    ORDER_SIDE_MAP = _ORDER_SIDE_NAMES
+    ORDER_TYPE_MAP = _UPSTOX_ORDER_TYPES
+    PRODUCT_TYPE_MAP = _UPSTOX_PRODUCT_TYPES
+    VALIDITY_MAP = _VALIDITY_NAMES
 
     def map_order_params(self, params: StandardOrderParams) -> dict[str, Any]:
         """Map to Upstox order format"""
+        price = params.price
+        trigger_price = params.trigger_price
         mapped = {
             "quantity": params.quantity,
-            "product": self.PRODUCT_TYPE_MAP[params.product_type],
-            "validity": self.VALIDITY_MAP[params.validity],
-            "price": float(params.price) if params.price else 0,
+            "product": _UPSTOX_PRODUCT_TYPES[params.product_type],
+            "validity": _VALIDITY_NAMES[params.validity],
+            "price": float(price) if price else 0,
             "tag": params.tag or "",
             "instrument_token": f"{params.exchange}_{params.symbol}",  # Upstox format
-            "order_type": self.ORDER_TYPE_MAP[params.order_type],
-            "transaction_type": self.ORDER_SIDE_MAP[params.order_side],
+            "order_type": _UPSTOX_ORDER_TYPES[params.order_type],
+            "transaction_type": _ORDER_SIDE_NAMES[params.order_side],
             "disclosed_quantity": params.disclosed_quantity,
-            "trigger_price": float(params.trigger_price) if params.trigger_price else 0,
+            "trigger_price": float(trigger_price) if trigger_price else 0,
             "is_amo": params.is_amo
         }
 
         # Add any extras
-        mapped.update(params.extras)
+        if params.extras:
+            mapped.update(params.extras)
         return mapped
 
     def map_quote_params(self, params: StandardQuoteParams) -> dict[str, Any]:
         """Map to Upstox quote format"""
         # Upstox uses comma-separated instrument keys
-        instrument_keys = []
-        exchange = params.exchange or "NSE"
-        for symbol in params.symbols:
-            instrument_keys.append(f"{exchange}_{symbol}")
+        prefix = (params.exchange or "NSE") + "_"
 
-        return {
-            "instrument_key": ",".join(instrument_keys),
-            **params.extras
+        mapped = {
+            "instrument_key": ",".join([prefix + symbol for symbol in params.symbols]),
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def map_historical_params(self, params: StandardHistoricalParams) -> dict[str, Any]:
         """Map to Upstox historical data format"""
-        return {
+        mapped = {
             "instrumentKey": f"{params.exchange}_{params.symbol}",
             "interval": params.interval,
             "from": params.from_date,
             "to": params.to_date,
             "limit": params.limit,
-            **params.extras
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def get_broker_name(self) -> str:
         return "upstox"
@@ -209,61 +268,40 @@ class UpstoxParameterMapper(IParameterMapper):
 class XTSParameterMapper(IParameterMapper):
     """Parameter mapper for XTS broker"""
 
-    ORDER_SIDE_MAP = {
-        OrderSide.BUY: "BUY",
-        OrderSide.SELL: "SELL"
-    }
-
-    ORDER_TYPE_MAP = {
-        OrderType.MARKET: "MARKET",
-        OrderType.LIMIT: "LIMIT",
-        OrderType.STOP_LOSS: "STOPLOSS",
-        OrderType.STOP_LOSS_MARKET: "STOPMARKET"
-    }
-
-    PRODUCT_TYPE_MAP = {
-        ProductType.INTRADAY: "MIS",
-        ProductType.DELIVERY: "CNC",
-        ProductType.MARGIN: "NRML"
-    }
-
-    VALIDITY_MAP = {
-        Validity.DAY: "DAY",
-        Validity.IOC: "IOC",
-        Validity.GTD: "GTD"
-    }
-
-    EXCHANGE_SEGMENT_MAP = {
-        "NSE": "NSECM",
-        "BSE": "BSECM",
-        "NFO": "NSEFO",
-        "BFO": "BSEFO"
-    }
+    ORDER_SIDE_MAP = _ORDER_SIDE_NAMES
+    ORDER_TYPE_MAP = _XTS_ORDER_TYPES
+    PRODUCT_TYPE_MAP = _XTS_PRODUCT_TYPES
+    VALIDITY_MAP = _VALIDITY_NAMES
+    EXCHANGE_SEGMENT_MAP = _XTS_EXCHANGE_SEGMENTS
 
     def map_order_params(self, params: StandardOrderParams) -> dict[str, Any]:
         """Map to XTS order format"""
         # XTS needs exchangeSegment and exchangeInstrumentID
-        exchange_segment = self.EXCHANGE_SEGMENT_MAP.get(params.exchange, params.exchange)
+        exchange = params.exchange
+        exchange_segment = _XTS_EXCHANGE_SEGMENTS.get(exchange, exchange)
 
         # Note: In real implementation, you'd need to resolve symbol to instrument ID
         # For now, we'll put a placeholder or use extras
         instrument_id = params.extras.get("exchangeInstrumentID", 0)
 
+        price = params.price
+        trigger_price = params.trigger_price
         mapped = {
             "exchangeSegment": exchange_segment,
             "exchangeInstrumentID": instrument_id,
-            "productType": self.PRODUCT_TYPE_MAP[params.product_type],
-            "orderType": self.ORDER_TYPE_MAP[params.order_type],
-            "orderSide": self.ORDER_SIDE_MAP[params.order_side],
-            "timeInForce": self.VALIDITY_MAP[params.validity],
+            "productType": _XTS_PRODUCT_TYPES[params.product_type],
+            "orderType": _XTS_ORDER_TYPES[params.order_type],
+            "orderSide": _ORDER_SIDE_NAMES[params.order_side],
+            "timeInForce": _VALIDITY_NAMES[params.validity],
             "disclosedQuantity": params.disclosed_quantity,
             "orderQuantity": params.quantity,
-            "limitPrice": float(params.price) if params.price else 0,
-            "stopPrice": float(params.trigger_price) if params.trigger_price else 0
+            "limitPrice": float(price) if price else 0,
+            "stopPrice": float(trigger_price) if trigger_price else 0
         }
 
         # Add any extras
-        mapped.update(params.extras)
+        if params.extras:
+            mapped.update(params.extras)
         return mapped
 
     def map_quote_params(self, params: StandardQuoteParams) -> dict[str, Any]:
@@ -272,22 +310,26 @@ class XTSParameterMapper(IParameterMapper):
         # In real implementation, you'd resolve symbols to IDs
         instrument_ids = params.extras.get("instruments", "")
 
-        return {
+        mapped = {
             "instruments": instrument_ids,
             "xtsMessageCode": params.extras.get("xtsMessageCode", 1512),
-            **{k: v for k, v in params.extras.items() if k not in ["instruments", "xtsMessageCode"]}
         }
+        if params.extras:
+            mapped.update((k, v) for k, v in params.extras.items() if k not in _XTS_QUOTE_RESERVED)
+        return mapped
 
     def map_historical_params(self, params: StandardHistoricalParams) -> dict[str, Any]:
         """Map to XTS historical data format"""
-        return {
-            "exchangeSegment": self.EXCHANGE_SEGMENT_MAP.get(params.exchange, params.exchange),
+        mapped = {
+            "exchangeSegment": _XTS_EXCHANGE_SEGMENTS.get(params.exchange, params.exchange),
             "exchangeInstrumentID": params.extras.get("exchangeInstrumentID", 0),
             "startTime": params.from_date,
             "endTime": params.to_date,
             "compressionType": params.interval,
-            **params.extras
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def get_broker_name(self) -> str:
         return "xts"
@@ -296,38 +338,48 @@ class XTSParameterMapper(IParameterMapper):
 class GrowwParameterMapper(IParameterMapper):
     """Parameter mapper for Groww broker"""
 
+    # Groww expects lower-case enum values
+    _SIDE_LOWER = {side: side.value.lower() for side in OrderSide}
+    _TYPE_LOWER = {order_type: order_type.value.lower() for order_type in OrderType}
+
     def map_order_params(self, params: StandardOrderParams) -> dict[str, Any]:
         """Map to Groww order format (if they have order APIs)"""
         # Groww typically doesn't have public order APIs
         # This is a placeholder implementation
-        return {
+        mapped = {
             "symbol": params.symbol,
             "exchange": params.exchange,
             "qty": params.quantity,
-            "side": params.order_side.value.lower(),
-            "orderType": params.order_type.value.lower(),
-            **params.extras
+            "side": self._SIDE_LOWER[params.order_side],
+            "orderType": self._TYPE_LOWER[params.order_type],
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def map_quote_params(self, params: StandardQuoteParams) -> dict[str, Any]:
         """Map to Groww quote format"""
         # Groww uses specific format for market data
-        return {
+        mapped = {
             "symbols": params.symbols,
             "exchange": params.exchange or "NSE",
-            **params.extras
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def map_historical_params(self, params: StandardHistoricalParams) -> dict[str, Any]:
         """Map to Groww historical data format"""
-        return {
+        mapped = {
             "symbol": params.symbol,
             "exchange": params.exchange,
             "interval": params.interval,
             "from": params.from_date,
             "to": params.to_date,
-            **params.extras
         }
+        if params.extras:
+            mapped.update(params.extras)
+        return mapped
 
     def get_broker_name(self) -> str:
         return "groww"
@@ -342,12 +394,18 @@ class ParameterMapperFactory:
         "groww": GrowwParameterMapper(),
     }
 
+    @classmethod
+    def find_mapper(cls, service_name: str) -> Optional[IParameterMapper]:
+        """Get parameter mapper for a service, or None if it has none"""
+        return cls._mappers.get(service_name)
+
     @classmethod
     def get_mapper(cls, service_name: str) -> IParameterMapper:
         """Get parameter mapper for a service"""
-        if service_name not in cls._mappers:
+        mapper = cls._mappers.get(service_name)
+        if mapper is None:
             raise ValueError(f"No parameter mapper found for service: {service_name}")
-        return cls._mappers[service_name]
+        return mapper
 
     @classmethod
     def register_mapper(cls, service_name: str, mapper: IParameterMapper):
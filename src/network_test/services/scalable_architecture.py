@@ -6,12 +6,19 @@ all trading endpoints across multiple brokers with standardized parameters,
 automatic mapping, validation, and robust error handling.
 """
 
+import asyncio
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from time import perf_counter_ns
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional,
+                    Sequence, Tuple)
+
+from .parameters import ParameterMapperFactory, StandardOrderParams
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +97,7 @@ class OperationType(Enum):
 # 2. PARAMETER SCHEMAS REGISTRY
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSchema:
     """
     📋 Parameter Schema - Like a Recipe Card!
@@ -116,19 +123,23 @@ class ParameterSchema:
     """
     operation: OperationType
     category: EndpointCategory
-    required_fields: List[str]
-    optional_fields: List[str] = field(default_factory=list)
+    required_fields: Sequence[str]
+    optional_fields: Sequence[str] = field(default_factory=list)
     validation_rules: List[Callable[[Dict[str, Any]], List[str]]] = field(default_factory=list)
     description: str = ""
+    _required_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._required_set = frozenset(self.required_fields)
 
     def validate(self, params: Dict[str, Any]) -> List[str]:
         """Validate parameters against schema"""
-        errors = []
-
-        # Check required fields
-        for field_name in self.required_fields:
-            if field_name not in params:
-                errors.append(f"Missing required field: {field_name}")
+        # Check required fields (set difference in C; report in declared order)
+        missing = self._required_set.difference(params)
+        errors = [
+            f"Missing required field: {field_name}"
+            for field_name in self.required_fields if field_name in missing
+        ] if missing else []
 
         # Run custom validation rules
         for rule in self.validation_rules:
@@ -147,20 +158,37 @@ class ParameterSchemaRegistry:
 
     _schemas: Dict[OperationType, ParameterSchema] = {}
 
+    # Cached list_operations() result, dropped when a new operation appears
+    _operations_view: Optional[Tuple[OperationType, ...]] = None
+
     @classmethod
     def register_schema(cls, schema: ParameterSchema):
         """Register a parameter schema"""
+        if schema.operation not in cls._schemas:
+            cls._operations_view = None
         cls._schemas[schema.operation] = schema
 
+    @classmethod
+    def register_schemas(cls, schemas: Iterable[ParameterSchema]):
+        """Register many parameter schemas with a single dict update"""
+        new_schemas = {schema.operation: schema for schema in schemas}
+        if not new_schemas:
+            return
+        if not new_schemas.keys() <= cls._schemas.keys():
+            cls._operations_view = None
+        cls._schemas.update(new_schemas)
+
     @classmethod
     def get_schema(cls, operation: OperationType) -> Optional[ParameterSchema]:
         """Get schema for an operation"""
         return cls._schemas.get(operation)
 
     @classmethod
-    def list_operations(cls) -> List[OperationType]:
+    def list_operations(cls) -> Tuple[OperationType, ...]:
         """List all registered operations"""
-        return list(cls._schemas.keys())
+        if cls._operations_view is None:
+            cls._operations_view = tuple(cls._schemas)
+        return cls._operations_view
 
     @classmethod
     def validate_params(cls, operation: OperationType, params: Dict[str, Any]) -> List[str]:
@@ -175,7 +203,7 @@ class ParameterSchemaRegistry:
 # 3. BROKER ENDPOINT MAPPING SYSTEM
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class BrokerEndpointMapping:
     """Maps standard operation to broker-specific endpoint details"""
     operation: OperationType
@@ -187,6 +215,14 @@ class BrokerEndpointMapping:
     rate_limit_group: str = "default"
     cache_ttl: int = 0
     extra_config: Dict[str, Any] = field(default_factory=dict)
+    _is_get: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._is_get = self.http_method == "GET"
+
+
+# Shared read-only default for brokers without mappings
+_NO_MAPPINGS: Mapping[OperationType, BrokerEndpointMapping] = MappingProxyType({})
 
 
 class BrokerMappingRegistry:
@@ -194,28 +230,70 @@ class BrokerMappingRegistry:
 
     _mappings: Dict[str, Dict[OperationType, BrokerEndpointMapping]] = {}
 
+    # Cached list_brokers() result, dropped when the set of brokers changes
+    _brokers_view: Optional[Tuple[str, ...]] = None
+
+    # Deferred configuration functions, run on first lookup of their broker
+    _loaders: Dict[str, Callable[[], None]] = {}
+
+    @classmethod
+    def register_loader(cls, broker_name: str, loader: Callable[[], None]):
+        """Register a function that populates a broker's mappings on first access"""
+        cls._loaders[broker_name] = loader
+
+    @classmethod
+    def _ensure_loaded(cls, broker_name: str):
+        """Run the deferred loader for a broker that has no mappings yet"""
+        if broker_name not in cls._mappings:
+            loader = cls._loaders.pop(broker_name, None)
+            if loader is not None:
+                loader()
+
     @classmethod
     def register_broker_mapping(cls, broker_name: str, mapping: BrokerEndpointMapping):
         """Register a broker endpoint mapping"""
-        if broker_name not in cls._mappings:
-            cls._mappings[broker_name] = {}
-        cls._mappings[broker_name][mapping.operation] = mapping
+        cls._broker_mappings(broker_name)[mapping.operation] = mapping
+
+    @classmethod
+    def bulk_register(cls, broker_name: str, mappings: Iterable[BrokerEndpointMapping]):
+        """Register many broker endpoint mappings with a single dict update"""
+        cls._broker_mappings(broker_name).update(
+            (mapping.operation, mapping) for mapping in mappings
+        )
+
+    @classmethod
+    def _broker_mappings(cls, broker_name: str) -> Dict[OperationType, BrokerEndpointMapping]:
+        """Fetch a broker's mapping dict with one lookup, creating it if needed"""
+        broker_mappings = cls._mappings.get(broker_name)
+        if broker_mappings is None:
+            broker_mappings = cls._mappings[broker_name] = {}
+            cls._brokers_view = None
+        return broker_mappings
 
     @classmethod
     def get_mapping(cls, broker_name: str, operation: OperationType) -> Optional[BrokerEndpointMapping]:
         """Get broker mapping for an operation"""
-        broker_mappings = cls._mappings.get(broker_name, {})
-        return broker_mappings.get(operation)
+        cls._ensure_loaded(broker_name)
+        return cls._mappings.get(broker_name, _NO_MAPPINGS).get(operation)
 
     @classmethod
     def get_supported_operations(cls, broker_name: str) -> List[OperationType]:
         """Get all supported operations for a broker"""
-        return list(cls._mappings.get(broker_name, {}).keys())
+        cls._ensure_loaded(broker_name)
+        return list(cls._mappings.get(broker_name, _NO_MAPPINGS))
+
+    @classmethod
+    def unregister_broker(cls, broker_name: str):
+        """Remove every mapping registered for a broker"""
+        if cls._mappings.pop(broker_name, None) is not None:
+            cls._brokers_view = None
 
     @classmethod
-    def list_brokers(cls) -> List[str]:
+    def list_brokers(cls) -> Tuple[str, ...]:
         """List all registered brokers"""
-        return list(cls._mappings.keys())
+        if cls._brokers_view is None:
+            cls._brokers_view = tuple(cls._mappings)
+        return cls._brokers_view
 
 
 # =====================================================
@@ -239,8 +317,14 @@ class IParameterTransformer(ABC):
 class TransformationPipeline:
     """Pipeline for transforming parameters through multiple stages"""
 
-    def __init__(self):
+    def __init__(self, copy_input: bool = True):
+        """
+        Args:
+            copy_input: Copy params before the first stage. Pipelines whose
+                stages never mutate their input can pass False to skip it.
+        """
         self.stages: List[Callable] = []
+        self._copy_input = copy_input
 
     def add_stage(self, transformer: Callable):
         """Add a transformation stage"""
@@ -248,7 +332,7 @@ class TransformationPipeline:
 
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute all transformation stages"""
-        result = params.copy()
+        result = params.copy() if self._copy_input else params
         for stage in self.stages:
             result = stage(result)
         return result
@@ -258,7 +342,7 @@ class TransformationPipeline:
 # 5. RESPONSE STANDARDIZATION
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class StandardResponse:
     """Standardized response format"""
     success: bool
@@ -270,6 +354,31 @@ class StandardResponse:
     operation: Optional[OperationType] = None
     execution_time_ms: Optional[float] = None
 
+    def to_json_dict(self, include_raw: bool = False) -> Dict[str, Any]:
+        """
+        Build a JSON-ready dict without dataclasses.asdict
+
+        None fields are omitted and the operation is emitted by value.
+        raw_response (often a large broker payload) is left out unless
+        include_raw is set; nothing is deep-copied.
+        """
+        result: Dict[str, Any] = {"success": self.success}
+        if self.data is not None:
+            result["data"] = self.data
+        if self.error is not None:
+            result["error"] = self.error
+        if self.error_code is not None:
+            result["error_code"] = self.error_code
+        if include_raw and self.raw_response is not None:
+            result["raw_response"] = self.raw_response
+        if self.broker_name is not None:
+            result["broker_name"] = self.broker_name
+        if self.operation is not None:
+            result["operation"] = self.operation.value
+        if self.execution_time_ms is not None:
+            result["execution_time_ms"] = self.execution_time_ms
+        return result
+
 
 class ResponseTransformer(ABC):
     """Base class for response transformers"""
@@ -305,8 +414,7 @@ class EndpointExecutor:
                               params: Dict[str, Any],
                               service_instance: Any) -> StandardResponse:
         """Execute a standardized operation"""
-        import time
-        start_time = time.time()
+        start_ns = perf_counter_ns()
 
         try:
             # 1. Validate parameters
@@ -329,17 +437,19 @@ class EndpointExecutor:
                     operation=operation
                 )
 
-            # 3. Transform parameters
-            transformed_params = params.copy()
+            # 3. Transform parameters (untransformed params are only read,
+            # never mutated, so they are passed through without a copy)
             if self.parameter_transformer:
                 transformed_params = self.parameter_transformer.transform(operation, params)
             elif mapping.parameter_transformer:
                 transformed_params = mapping.parameter_transformer(params)
+            else:
+                transformed_params = params
 
             # 4. Execute broker-specific call
             raw_response = await service_instance.call_endpoint(
                 mapping.broker_endpoint_name,
-                **(transformed_params if mapping.http_method in ["GET"] else {"json_data": transformed_params})
+                **(transformed_params if mapping._is_get else {"json_data": transformed_params})
             )
 
             # 5. Transform response
@@ -354,7 +464,7 @@ class EndpointExecutor:
                     operation=operation
                 )
 
-            result.execution_time_ms = (time.time() - start_time) * 1000
+            result.execution_time_ms = (perf_counter_ns() - start_ns) / 1_000_000
             return result
 
         except Exception as e:
@@ -363,7 +473,7 @@ class EndpointExecutor:
                 error=str(e),
                 broker_name=self.broker_name,
                 operation=operation,
-                execution_time_ms=(time.time() - start_time) * 1000
+                execution_time_ms=(perf_counter_ns() - start_ns) / 1_000_000
             )
 
 
@@ -376,13 +486,15 @@ def standard_operation(operation: OperationType):
     def decorator(func):
         func._standard_operation = operation
 
+        # Kept a coroutine function so inspect.iscoroutinefunction() still
+        # recognises the decorated operations
         @wraps(func)
         async def wrapper(self, **kwargs):
-            if hasattr(self, '_endpoint_executor'):
-                return await self._endpoint_executor.execute_operation(operation, kwargs, self)
-            else:
-                # Fallback to original method
-                return await func(self, **kwargs)
+            executor = getattr(self, '_endpoint_executor', None)
+            if executor is not None:
+                return await executor.execute_operation(operation, kwargs, self)
+            # Fallback to original method
+            return await func(self, **kwargs)
 
         return wrapper
     return decorator
@@ -392,6 +504,58 @@ def standard_operation(operation: OperationType):
 # 8. CONFIGURATION BUILDER
 # =====================================================
 
+@dataclass(frozen=True, slots=True)
+class OperationConfig:
+    """
+    Static description of one broker operation.
+
+    Broker modules declare their operations as module-level tuples of these,
+    so the configuration is resolved once at import and can be handed to
+    BrokerConfigurationBuilder.add_operations() as a whole.
+    """
+    operation: OperationType
+    broker_endpoint: str
+    http_method: str = "GET"
+    required_fields: Tuple[str, ...] = ()
+    optional_fields: Tuple[str, ...] = ()
+    parameter_transformer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    requires_auth: bool = True
+    cache_ttl: int = 0
+
+    def to_mapping(self) -> BrokerEndpointMapping:
+        """Build the broker endpoint mapping described by this operation"""
+        return BrokerEndpointMapping(
+            operation=self.operation,
+            broker_endpoint_name=self.broker_endpoint,
+            http_method=self.http_method,
+            parameter_transformer=self.parameter_transformer,
+            requires_auth=self.requires_auth,
+            cache_ttl=self.cache_ttl
+        )
+
+
+def _categorize_operation(operation: OperationType) -> EndpointCategory:
+    """Derive an operation's category from its name prefix"""
+    if operation.value.startswith(('place_', 'modify_', 'cancel_', 'get_order')):
+        return EndpointCategory.ORDERS
+    elif operation.value.startswith(('get_position', 'get_holding')):
+        return EndpointCategory.PORTFOLIO
+    elif operation.value.startswith(('get_quote', 'get_market', 'search_')):
+        return EndpointCategory.MARKET_DATA
+    elif operation.value.startswith(('get_candle', 'get_historical')):
+        return EndpointCategory.HISTORICAL
+    elif operation.value.startswith(('get_profile', 'get_fund')):
+        return EndpointCategory.USER_PROFILE
+    else:
+        return EndpointCategory.MARKET_DATA
+
+
+# Prefix rules evaluated once per operation at import
+_OPERATION_CATEGORIES: Dict[OperationType, EndpointCategory] = {
+    operation: _categorize_operation(operation) for operation in OperationType
+}
+
+
 class BrokerConfigurationBuilder:
     """Builder for setting up broker configurations"""
 
@@ -404,8 +568,8 @@ class BrokerConfigurationBuilder:
                      operation: OperationType,
                      broker_endpoint: str,
                      http_method: str = "GET",
-                     required_fields: Optional[List[str]] = None,
-                     optional_fields: Optional[List[str]] = None,
+                     required_fields: Optional[Iterable[str]] = None,
+                     optional_fields: Optional[Iterable[str]] = None,
                      parameter_transformer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
                      **kwargs: Any) -> 'BrokerConfigurationBuilder':
         """Add an operation configuration"""
@@ -422,64 +586,87 @@ class BrokerConfigurationBuilder:
 
         # Create schema if not exists
         existing_schema = ParameterSchemaRegistry.get_schema(operation)
-        if not existing_schema and required_fields:
+        required = tuple(map(sys.intern, required_fields or ()))
+        if not existing_schema and required:
             schema = ParameterSchema(
                 operation=operation,
                 category=self._get_category_for_operation(operation),
-                required_fields=required_fields or [],
-                optional_fields=optional_fields or []
+                required_fields=required,
+                optional_fields=tuple(map(sys.intern, optional_fields or ()))
             )
             self.schemas.append(schema)
 
         return self
 
+    def add_operations(self, operations: Iterable[OperationConfig]) -> 'BrokerConfigurationBuilder':
+        """
+        Add a batch of predefined operation configurations in one pass.
+
+        Unlike add_operation, field tuples are taken as-is: OperationConfig
+        tables are module-level literals whose names are already interned.
+        """
+        operations = tuple(operations)
+        self.mappings.extend(op.to_mapping() for op in operations)
+
+        get_schema = ParameterSchemaRegistry.get_schema
+        self.schemas.extend(
+            ParameterSchema(
+                operation=op.operation,
+                category=self._get_category_for_operation(op.operation),
+                required_fields=op.required_fields,
+                optional_fields=op.optional_fields
+            )
+            for op in operations
+            if op.required_fields and not get_schema(op.operation)
+        )
+        return self
+
     def _get_category_for_operation(self, operation: OperationType) -> EndpointCategory:
         """Determine category for an operation"""
-        if operation.value.startswith(('place_', 'modify_', 'cancel_', 'get_order')):
-            return EndpointCategory.ORDERS
-        elif operation.value.startswith(('get_position', 'get_holding')):
-            return EndpointCategory.PORTFOLIO
-        elif operation.value.startswith(('get_quote', 'get_market', 'search_')):
-            return EndpointCategory.MARKET_DATA
-        elif operation.value.startswith(('get_candle', 'get_historical')):
-            return EndpointCategory.HISTORICAL
-        elif operation.value.startswith(('get_profile', 'get_fund')):
-            return EndpointCategory.USER_PROFILE
-        else:
-            return EndpointCategory.MARKET_DATA
+        return _OPERATION_CATEGORIES.get(operation, EndpointCategory.MARKET_DATA)
 
     def build(self):
         """Build and register the configuration"""
         # Register all mappings
-        for mapping in self.mappings:
-            BrokerMappingRegistry.register_broker_mapping(self.broker_name, mapping)
+        BrokerMappingRegistry.bulk_register(self.broker_name, self.mappings)
 
         # Register all schemas
-        for schema in self.schemas:
-            ParameterSchemaRegistry.register_schema(schema)
+        ParameterSchemaRegistry.register_schemas(self.schemas)
 
-        logger.info(f"Registered {len(self.mappings)} operations for broker {self.broker_name}")
+        logger.info("Registered %d operations for broker %s", len(self.mappings), self.broker_name)
 
 
 # =====================================================
 # 9. UNIFIED SERVICE MIXIN
 # =====================================================
 
+def _order_kwargs(order: StandardOrderParams) -> Dict[str, Any]:
+    """Flatten standard order params into place_order_standard keyword arguments"""
+    params = order.to_dict()
+    extras = params.pop("extras")
+    params = {name: value for name, value in params.items() if value is not None}
+    params.update(extras)
+    return params
+
+
 class StandardizedOperationsMixin:
     """Mixin to add standardized operations to any service"""
 
     def __init_standardized_operations__(self, broker_name: str):
         """Initialize standardized operations support"""
+        # broker_configurations builds on this module, so it is imported here.
+        # Configuring up front also registers the schemas that validation needs
+        # before the executor's first mapping lookup
+        from .broker_configurations import BrokerConfigurationRegistry
+        BrokerConfigurationRegistry.ensure_configured(broker_name)
+
         self._endpoint_executor = EndpointExecutor(broker_name)
 
-        # Set up transformers if available
-        from .parameters import ParameterMapperFactory
-        try:
-            mapper = ParameterMapperFactory.get_mapper(broker_name)
-            if hasattr(mapper, 'transform'):
-                self._endpoint_executor.set_parameter_transformer(mapper)
-        except AttributeError:
-            pass  # No transformer available
+        # Set up transformers if available (brokers without a mapper, such
+        # as custom services, simply run untransformed)
+        mapper = ParameterMapperFactory.find_mapper(broker_name)
+        if mapper is not None and hasattr(mapper, 'transform'):
+            self._endpoint_executor.set_parameter_transformer(mapper)
 
     @standard_operation(OperationType.PLACE_ORDER)
     async def place_order_standard(self, **kwargs) -> StandardResponse:
@@ -511,4 +698,19 @@ class StandardizedOperationsMixin:
         """Standardized get holdings operation"""
         pass
 
+    async def place_orders_standard(self, orders: Iterable[StandardOrderParams]) -> List[StandardResponse]:
+        """
+        Place several orders concurrently.
+
+        Orders are submitted together instead of one round trip after
+        another (still bounded by the service's in-flight limit), and
+        responses are returned in the same order.
+        """
+        # Go straight to the executor: on trading services the interface's
+        # place_order_standard stub comes before this mixin in the MRO
+        execute = self._endpoint_executor.execute_operation
+        return await asyncio.gather(
+            *(execute(OperationType.PLACE_ORDER, _order_kwargs(order), self) for order in orders)
+        )
+
     # Add more standardized operations as needed...
@@ -5,10 +5,12 @@ This service provides access to Upstox API endpoints with proper authentication,
 rate limiting, caching, and error handling.
 """
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..config import UPSTOX_API_CONFIG
 from .base_service import BaseTradingService
+from .batching import RequestBatcher
 from .models import EndpointConfig
 
 
@@ -18,10 +20,18 @@ class UpstoxService(BaseTradingService):
 
     Provides access to Upstox API endpoints with proper authentication,
     rate limiting, caching, and error handling.
+
+    Set ``enable_quote_batching=True`` to coalesce concurrent ``get_quote``
+    calls into one request per batch (tuned with ``quote_batch_interval_ms``
+    and ``quote_batch_size``).
     """
 
-    # Predefined endpoints with their configurations
-    _ENDPOINTS = {
+    # Created on first batched get_quote call (needs a running event loop)
+    _quote_batcher: Optional[RequestBatcher] = None
+
+    # Predefined endpoints, shared read-only; config-supplied endpoints are
+    # overlaid on a per-instance copy (see _load_custom_endpoints)
+    _ENDPOINTS: Mapping[str, EndpointConfig] = MappingProxyType({
         # Market Data Endpoints
         "candles": EndpointConfig(
             path="chart/open/v3/candles/",
@@ -103,7 +113,7 @@ class UpstoxService(BaseTradingService):
             cache_ttl=3600,  # Profile changes rarely
             description="Get user profile information"
         ),
-    }
+    })
 
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for Upstox service."""
@@ -121,27 +131,27 @@ class UpstoxService(BaseTradingService):
         """Get default base URL for Upstox API."""
         return 'https://api.upstox.com/v2/'
 
-    def get_service_endpoints(self) -> Dict[str, EndpointConfig]:
+    def get_service_endpoints(self) -> Mapping[str, EndpointConfig]:
         """Get service-specific endpoint configurations."""
         return self._ENDPOINTS
 
+    def _load_custom_endpoints(self, endpoints_config: Dict[str, Any]) -> None:
+        """Load config endpoints into this instance's own copy of the table."""
+        self._ENDPOINTS = dict(self._ENDPOINTS)
+        super()._load_custom_endpoints(endpoints_config)
+
     def get_service_name(self) -> str:
         """Return the service name identifier"""
         return "upstox"
 
     def _apply_authentication(self, headers: Dict[str, str]) -> None:
         """Apply Upstox-specific authentication."""
-        # Get auth config from service config
-        access_token = self.config.get("access_token")
-        api_key = self.config.get("api_key")
-
-        # Upstox uses Bearer token authentication
-        if access_token:
-            self._add_bearer_token(headers, access_token)
-
-        # Some Upstox endpoints might need API key in headers
-        if api_key:
-            self._add_api_key_header(headers, api_key, "X-API-Key")
+        self._apply_auth(headers, {
+            # Upstox uses Bearer token authentication
+            "bearer": self.config.get("access_token"),
+            # Some Upstox endpoints might need API key in headers
+            "api_key": ("X-API-Key", self.config.get("api_key")),
+        })
 
     # Convenient methods for common operations (specific to Upstox)
     async def get_candles(self,
@@ -162,11 +172,46 @@ class UpstoxService(BaseTradingService):
 
     async def get_quote(self, instrument_key: str) -> Dict[str, Any]:
         """Get live quote for an instrument"""
+        if self.config.get("enable_quote_batching", False):
+            return await self._get_quote_batcher().get(instrument_key)
         return await self.call_endpoint(
             "quote",
             query_params={"instrument_key": instrument_key}
         )
 
+    def _get_quote_batcher(self) -> RequestBatcher:
+        """Return the quote batcher, creating it on first use."""
+        if self._quote_batcher is None:
+            self._quote_batcher = RequestBatcher(
+                self._fetch_quotes,
+                batch_interval_ms=self.config.get("quote_batch_interval_ms", 10),
+                max_batch_size=self.config.get("quote_batch_size", 20),
+            )
+        return self._quote_batcher
+
+    async def _fetch_quotes(self, instrument_keys: List[str]) -> Dict[str, Any]:
+        """
+        Fetch quotes for several instruments in one request.
+
+        Upstox keys the response by trading symbol, so each quote is matched
+        back to its instrument key through ``instrument_token`` and returned
+        in the same shape as a single-instrument response. Any other response
+        (e.g. a broker error) is handed unchanged to every caller in the batch,
+        just as the unbatched call would return it.
+        """
+        response = await self.call_endpoint(
+            "quote",
+            query_params={"instrument_key": ",".join(instrument_keys)}
+        )
+        if not (isinstance(response, dict) and response.get("status") == "success"
+                and isinstance(response.get("data"), dict)):
+            return dict.fromkeys(instrument_keys, response)
+        quotes = response["data"]
+        return {
+            quote.get("instrument_token"): {**response, "data": {symbol: quote}}
+            for symbol, quote in quotes.items()
+        }
+
     async def place_order(self,
                          quantity: int,
                          product: str,
@@ -5,7 +5,8 @@ XTS (Symphony Fintech) Trading Service implementation that provides separate
 Interactive API (trading) and Market Data API endpoints.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Optional, Tuple
 
 from .base_service import BaseTradingService
 from .models import EndpointConfig
@@ -33,7 +34,7 @@ class XTSService(BaseTradingService):
     """
 
     # Interactive API endpoints
-    _INTERACTIVE_ENDPOINTS = {
+    _INTERACTIVE_ENDPOINTS: Mapping[str, EndpointConfig] = MappingProxyType({
         # User Management
         "user.login": EndpointConfig(
             path="/user/session",
@@ -105,10 +106,10 @@ class XTSService(BaseTradingService):
             cache_ttl=60,
             description="Get portfolio holdings"
         ),
-    }
+    })
 
     # Market Data API endpoints
-    _MARKET_ENDPOINTS = {
+    _MARKET_ENDPOINTS: Mapping[str, EndpointConfig] = MappingProxyType({
         # Authentication
         "market.login": EndpointConfig(
             path="/apimarketdata/auth/login",
@@ -150,8 +151,23 @@ class XTSService(BaseTradingService):
             cache_ttl=300,
             description="Search instruments by string"
         ),
+    })
+
+    # Combined endpoint table, built once and shared read-only; config-supplied
+    # endpoints are overlaid on a per-instance copy (see _load_custom_endpoints)
+    _ENDPOINTS: Mapping[str, EndpointConfig] = MappingProxyType(
+        {**_INTERACTIVE_ENDPOINTS, **_MARKET_ENDPOINTS}
+    )
+
+    # API -> (login endpoint, token attribute, logged-in flag, token header)
+    _LOGINS: ClassVar[Dict[str, Tuple[str, str, str, str]]] = {
+        "interactive": ("user.login", "interactive_token", "is_interactive_logged_in", "authorization"),
+        "market": ("market.login", "market_token", "is_market_logged_in", "x-market-token"),
     }
 
+    # Endpoints served by the Market Data API base URL
+    _MARKET_ENDPOINT_NAMES: FrozenSet[str] = frozenset(_MARKET_ENDPOINTS)
+
     def __init__(self, **kwargs):
         """Initialize XTS service with dual API support."""
         self.interactive_token = None
@@ -159,11 +175,23 @@ class XTSService(BaseTradingService):
         self.is_interactive_logged_in = False
         self.is_market_logged_in = False
 
-        # Combine all endpoints
-        self._all_endpoints = {**self._INTERACTIVE_ENDPOINTS, **self._MARKET_ENDPOINTS}
-
         super().__init__(**kwargs)
 
+        # Request source sent in login payloads and searches (see set_source)
+        self._source = self.config.get("source", "WebAPI")
+
+        # Resolved once; market calls pass it per request instead of
+        # swapping the shared client's base_url
+        market_base_url = self.config.get('market_base_url',
+                                          'https://developers.symphonyfintech.in/marketdata/')
+        self._market_base_url = market_base_url.rstrip("/") + "/"
+
+        # Endpoint name -> base URL override; interactive endpoints are absent
+        # and fall through to the client's own base URL
+        self._endpoint_base_urls: Dict[str, str] = dict.fromkeys(
+            self._MARKET_ENDPOINT_NAMES, self._market_base_url
+        )
+
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for XTS service."""
         return {
@@ -179,9 +207,17 @@ class XTSService(BaseTradingService):
         """Get default base URL (Interactive API by default)."""
         return self.config.get('interactive_base_url', 'https://developers.symphonyfintech.in/interactive/')
 
-    def get_service_endpoints(self) -> Dict[str, EndpointConfig]:
+    def get_service_endpoints(self) -> Mapping[str, EndpointConfig]:
         """Get all XTS endpoints (Interactive + Market Data)."""
-        return self._all_endpoints
+        return self._ENDPOINTS
+
+    def _load_custom_endpoints(self, endpoints_config: Dict[str, Any]) -> None:
+        """Load config endpoints into this instance's own copy of the tables."""
+        self._ENDPOINTS = dict(self._ENDPOINTS)
+        self._MARKET_ENDPOINT_NAMES = self._MARKET_ENDPOINT_NAMES.union(
+            name for name in endpoints_config if name.startswith("market.")
+        )
+        super()._load_custom_endpoints(endpoints_config)
 
     def get_service_name(self) -> str:
         """Return the service name identifier"""
@@ -201,79 +237,62 @@ class XTSService(BaseTradingService):
         source = self.config.get("source", "WebAPI")
         headers["source"] = source
 
+    def set_source(self, source: str) -> None:
+        """Change the request source used for headers, logins and searches."""
+        self.config["source"] = source
+        self._source = source
+        self.client.default_headers["source"] = source
+
     async def call_endpoint(self,
                           endpoint_name: str,
                           path_params: Optional[Dict[str, str]] = None,
                           query_params: Optional[Dict[str, Any]] = None,
                           json_data: Optional[Dict[str, Any]] = None,
+                          base_url_override: Optional[str] = None,
                           **kwargs) -> Any:
         """
         Override call_endpoint to handle dual base URLs.
         Market Data API calls use different base URL.
         """
-        # Determine which API this endpoint belongs to
-        if endpoint_name.startswith("market."):
-            # Use market data base URL
-            original_base_url = self.client.base_url
-            self.client.base_url = self.config.get('market_base_url',
-                                                 'https://developers.symphonyfintech.in/marketdata/')
-
-            try:
-                result = await super().call_endpoint(endpoint_name, path_params,
-                                                   query_params, json_data, **kwargs)
-                return result
-            finally:
-                # Restore original base URL
-                self.client.base_url = original_base_url
-        else:
-            # Use interactive base URL (default)
-            return await super().call_endpoint(endpoint_name, path_params,
-                                             query_params, json_data, **kwargs)
+        return await super().call_endpoint(
+            endpoint_name, path_params, query_params, json_data,
+            base_url_override or self._endpoint_base_urls.get(endpoint_name),
+            **kwargs
+        )
 
     # Authentication convenience methods
     async def login_interactive(self, user_id: Optional[str] = None, password: Optional[str] = None,
                               public_key: Optional[str] = None, private_key: Optional[str] = None) -> Dict[str, Any]:
         """Login to Interactive API."""
-        login_data = {
-            "userId": user_id or self.config.get("user_id"),
-            "password": password or self.config.get("password"),
-            "publicKey": public_key or self.config.get("public_key"),
-            "privateKey": private_key or self.config.get("private_key"),
-            "source": self.config.get("source", "WebAPI")
-        }
-
-        response = await self.call_endpoint("user.login", json_data=login_data)
-
-        # Store token for future requests
-        if response and "token" in response:
-            self.interactive_token = response["token"]
-            self.is_interactive_logged_in = True
-
-            # Update client headers
-            self.client.default_headers["authorization"] = self.interactive_token
-
-        return response
+        return await self._login("interactive", user_id, password, public_key, private_key)
 
     async def login_market(self, user_id: Optional[str] = None, password: Optional[str] = None,
                          public_key: Optional[str] = None, private_key: Optional[str] = None) -> Dict[str, Any]:
         """Login to Market Data API."""
+        return await self._login("market", user_id, password, public_key, private_key)
+
+    async def _login(self, api: str, user_id: Optional[str], password: Optional[str],
+                     public_key: Optional[str], private_key: Optional[str]) -> Dict[str, Any]:
+        """Log in to one of the XTS APIs and store its session token."""
+        endpoint_name, token_attr, flag_attr, header_name = self._LOGINS[api]
         login_data = {
             "userId": user_id or self.config.get("user_id"),
             "password": password or self.config.get("password"),
             "publicKey": public_key or self.config.get("public_key"),
             "privateKey": private_key or self.config.get("private_key"),
-            "source": self.config.get("source", "WebAPI")
+            "source": self._source
         }
 
-        response = await self.call_endpoint("market.login", json_data=login_data)
+        response = await self.call_endpoint(endpoint_name, json_data=login_data)
 
         # Store token for future requests
         if response and "token" in response:
-            self.market_token = response["token"]
-            self.is_market_logged_in = True
+            token = response["token"]
+            setattr(self, token_attr, token)
+            setattr(self, flag_attr, True)
 
             # Update client headers
-            self.client.default_headers["x-market-token"] = self.market_token
+            self.client.default_headers[header_name] = token
 
         return response
 
@@ -315,6 +334,6 @@ class XTSService(BaseTradingService):
             "market.search.instrumentsbystring",
             query_params={
                 "searchString": searchString,
-                "source": source or self.config.get("source", "WebAPI")
+                "source": source or self._source
             }
         )
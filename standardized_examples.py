@@ -6,16 +6,36 @@ that works consistently across all broker services.
 """
 
 import asyncio
+from dataclasses import replace
 from decimal import Decimal
+from functools import cache
 
 from src.network_test.services import GrowwService, UpstoxService, XTSService
 from src.network_test.services.parameters import (OrderSide, OrderType,
+                                                  ParameterMapperFactory,
                                                   ProductType,
                                                   StandardHistoricalParams,
                                                   StandardOrderParams,
                                                   StandardQuoteParams,
                                                   Validity)
 
+# Each broker's parameter mapper, resolved once for all demos
+_MAPPERS = {name: ParameterMapperFactory.get_mapper(name) for name in ("upstox", "xts", "groww")}
+
+
+@cache
+def _order_brokers() -> tuple:
+    """(display name, service, extras) per broker, built once on first use.
+
+    Services set up an aiohttp connection pool, which needs a running event
+    loop, so they are created lazily from the first demo rather than at import.
+    """
+    return (
+        ("Upstox", UpstoxService(), {}),
+        ("XTS", XTSService(), {"exchangeInstrumentID": 26000}),
+        ("Groww", GrowwService(), {}),
+    )
+
 
 async def demo_standardized_order_placement():
     """Demo: Placing orders with standardized parameters across different brokers"""
@@ -46,28 +66,17 @@ async def demo_standardized_order_placement():
     print(f"   Validity: {order_params.validity.value}")
 
     # Demo with different brokers
-    brokers = [
-        {"name": "Upstox", "service": UpstoxService, "config": {}},
-        {"name": "XTS", "service": XTSService, "config": {"exchangeInstrumentID": 26000}},
-        {"name": "Groww", "service": GrowwService, "config": {}}
-    ]
-
-    for broker in brokers:
-        print(f"\n🏛️ {broker['name']} Broker:")
-
-        # Add broker-specific extras if needed
-        if broker['config']:
-            order_params.extras.update(broker['config'])
+    for name, service, extras in _order_brokers():
+        print(f"\n🏛️ {name} Broker:")
 
         try:
             # This would work the same way for all brokers!
-            service = broker['service']()
+            # Broker-specific extras go on a copy so they don't leak into the next broker
+            broker_params = replace(order_params, extras=order_params.extras | extras) if extras else order_params
 
             # Get the broker-specific mapped parameters
-            from src.network_test.services.parameters import \
-                ParameterMapperFactory
-            mapper = ParameterMapperFactory.get_mapper(service.get_service_name())
-            mapped_params = mapper.map_order_params(order_params)
+            mapper = _MAPPERS[service.get_service_name()]
+            mapped_params = mapper.map_order_params(broker_params)
 
             print(f"   ✅ Mapped Parameters: {mapped_params}")
             print("   ℹ️ Would execute: await service.place_order_standard(order_params)")
@@ -75,6 +84,9 @@ async def demo_standardized_order_placement():
         except Exception as e:
             print(f"   ❌ Error: {e}")
 
+    # Every broker mapped its own copy; the shared order is untouched
+    assert order_params.extras == {}, f"broker extras leaked into order: {order_params.extras}"
+
 
 async def demo_standardized_quotes():
     """Demo: Getting quotes with standardized parameters"""
@@ -91,15 +103,10 @@ async def demo_standardized_quotes():
     print(f"   Exchange: {quote_params.exchange}")
 
     # Demo with different brokers
-    brokers = ["upstox", "xts", "groww"]
-
-    for broker_name in brokers:
+    for broker_name, mapper in _MAPPERS.items():
         print(f"\n🏛️ {broker_name.title()} Broker:")
 
         try:
-            from src.network_test.services.parameters import \
-                ParameterMapperFactory
-            mapper = ParameterMapperFactory.get_mapper(broker_name)
             mapped_params = mapper.map_quote_params(quote_params)
 
             print(f"   ✅ Mapped Parameters: {mapped_params}")
@@ -132,15 +139,10 @@ async def demo_standardized_historical_data():
     print(f"   Limit: {historical_params.limit}")
 
     # Demo with different brokers
-    brokers = ["upstox", "xts", "groww"]
-
-    for broker_name in brokers:
+    for broker_name, mapper in _MAPPERS.items():
         print(f"\n🏛️ {broker_name.title()} Broker:")
 
         try:
-            from src.network_test.services.parameters import \
-                ParameterMapperFactory
-            mapper = ParameterMapperFactory.get_mapper(broker_name)
             mapped_params = mapper.map_historical_params(historical_params)
 
             print(f"   ✅ Mapped Parameters: {mapped_params}")
@@ -152,46 +154,49 @@ async def demo_standardized_historical_data():
 
 async def demo_comparison_old_vs_new():
     """Demo: Comparison between old broker-specific and new standardized approach"""
-    print("\n🔄 DEMO: Old vs New Approach Comparison\n")
-
-    print("❌ OLD WAY - Broker-specific parameters:")
-    print("   # Upstox")
-    print("   await upstox.place_order(")
-    print("       quantity=1, product='I', validity='DAY', price=2500.50,")
-    print("       tag='demo', instrument_token='NSE_RELIANCE',")
-    print("       order_type='LIMIT', transaction_type='BUY'")
-    print("   )")
-    print()
-    print("   # XTS")
-    print("   await xts.place_order(")
-    print("       exchangeSegment='NSECM', exchangeInstrumentID=26000,")
-    print("       productType='MIS', orderType='LIMIT', orderSide='BUY',")
-    print("       timeInForce='DAY', orderQuantity=1, limitPrice=2500.50")
-    print("   )")
-    print()
-    print("   # Groww")
-    print("   await groww.place_order(")
-    print("       symbol='RELIANCE', exchange='NSE', qty=1,")
-    print("       side='buy', orderType='limit', price=2500.50")
-    print("   )")
-
-    print("\n✅ NEW WAY - Standardized parameters:")
-    print("   # Works with ANY broker!")
-    print("   order_params = StandardOrderParams(")
-    print("       symbol='RELIANCE', exchange='NSE', quantity=1,")
-    print("       order_side=OrderSide.BUY, order_type=OrderType.LIMIT,")
-    print("       product_type=ProductType.INTRADAY, price=2500.50")
-    print("   )")
-    print()
-    print("   await any_broker_service.place_order_standard(order_params)")
-
-    print("\n🎯 Benefits of New Approach:")
-    print("   ✅ Same code works with any broker")
-    print("   ✅ Type-safe with enums")
-    print("   ✅ Clear, readable parameter names")
-    print("   ✅ Consistent validation")
-    print("   ✅ Easy to switch brokers")
-    print("   ✅ Reduced errors from wrong parameter names")
+    # One write for the whole static comparison instead of a print per line
+    print("\n".join([
+        "\n🔄 DEMO: Old vs New Approach Comparison\n",
+
+        "❌ OLD WAY - Broker-specific parameters:",
+        "   # Upstox",
+        "   await upstox.place_order(",
+        "       quantity=1, product='I', validity='DAY', price=2500.50,",
+        "       tag='demo', instrument_token='NSE_RELIANCE',",
+        "       order_type='LIMIT', transaction_type='BUY'",
+        "   )",
+        "",
+        "   # XTS",
+        "   await xts.place_order(",
+        "       exchangeSegment='NSECM', exchangeInstrumentID=26000,",
+        "       productType='MIS', orderType='LIMIT', orderSide='BUY',",
+        "       timeInForce='DAY', orderQuantity=1, limitPrice=2500.50",
+        "   )",
+        "",
+        "   # Groww",
+        "   await groww.place_order(",
+        "       symbol='RELIANCE', exchange='NSE', qty=1,",
+        "       side='buy', orderType='limit', price=2500.50",
+        "   )",
+
+        "\n✅ NEW WAY - Standardized parameters:",
+        "   # Works with ANY broker!",
+        "   order_params = StandardOrderParams(",
+        "       symbol='RELIANCE', exchange='NSE', quantity=1,",
+        "       order_side=OrderSide.BUY, order_type=OrderType.LIMIT,",
+        "       product_type=ProductType.INTRADAY, price=2500.50",
+        "   )",
+        "",
+        "   await any_broker_service.place_order_standard(order_params)",
+
+        "\n🎯 Benefits of New Approach:",
+        "   ✅ Same code works with any broker",
+        "   ✅ Type-safe with enums",
+        "   ✅ Clear, readable parameter names",
+        "   ✅ Consistent validation",
+        "   ✅ Easy to switch brokers",
+        "   ✅ Reduced errors from wrong parameter names",
+    ]))
 
 
 async def demo_advanced_usage():
@@ -206,21 +211,15 @@ async def demo_advanced_usage():
         order_side=OrderSide.BUY,
         order_type=OrderType.LIMIT,
         product_type=ProductType.INTRADAY,
-        price=2500.0
+        price=Decimal("2500.0")
     )
 
     print("📋 Base Order (works everywhere):")
     print(f"   {base_order.symbol} {base_order.order_side.value} {base_order.quantity} @ ₹{base_order.price}")
 
     # Upstox-specific features
-    upstox_order = StandardOrderParams(
-        symbol=base_order.symbol,
-        exchange=base_order.exchange,
-        quantity=base_order.quantity,
-        order_side=base_order.order_side,
-        order_type=base_order.order_type,
-        product_type=base_order.product_type,
-        price=base_order.price,
+    upstox_order = replace(
+        base_order,
         extras={
             "is_amo": True,  # After Market Order
             "user_order_id": "UPX123"  # Upstox custom field
@@ -232,14 +231,8 @@ async def demo_advanced_usage():
     print(f"   Extras: {upstox_order.extras}")
 
     # XTS-specific features
-    xts_order = StandardOrderParams(
-        symbol=base_order.symbol,
-        exchange=base_order.exchange,
-        quantity=base_order.quantity,
-        order_side=base_order.order_side,
-        order_type=base_order.order_type,
-        product_type=base_order.product_type,
-        price=base_order.price,
+    xts_order = replace(
+        base_order,
         extras={
             "exchangeInstrumentID": 26000,  # Required by XTS
             "parentOrderId": "XTS456",      # For bracket orders
@@ -256,6 +249,9 @@ async def demo_advanced_usage():
     print("   await upstox_service.place_order_standard(upstox_order)")
     print("   await xts_service.place_order_standard(xts_order)")
     print("   # Automatically maps extras to broker-specific format!")
+    print()
+    print("   # Several orders at once (submitted concurrently, results in order)")
+    print("   await upstox_service.place_orders_standard([base_order, upstox_order])")
 
 
 async def main():
@@ -0,0 +1,406 @@
+"""
+Tests for BaseTradingService request plumbing
+
+These tests exercise call_endpoint and authentication helpers without
+making real HTTP requests by swapping the network client's request method.
+"""
+
+import asyncio
+import dataclasses
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.network_test.network import (_credential_headers, _json_dumps,
+                                      close_shared_connectors)
+from src.network_test.services.custom_service import (CustomAPIService, _endpoint_config,
+                                                      _validate_endpoints)
+from src.network_test.services.groww_service import GrowwService
+from src.network_test.services.models import EndpointConfig
+from src.network_test.services.upstox_service import UpstoxService
+from src.network_test.services.xts_service import XTSService
+
+
+class RecordingClient:
+    """Stand-in for AsyncNetworkClient.request that records calls"""
+
+    def __init__(self, delay: float = 0):
+        self.calls = []
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def request(self, **kwargs):
+        self.calls.append(kwargs)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"ok": True}
+
+
+async def make_service(**kwargs) -> UpstoxService:
+    return UpstoxService(**kwargs)
+
+
+async def test_call_endpoint_respects_max_inflight():
+    """call_endpoint never has more than max_inflight requests outstanding"""
+    service = await make_service(max_inflight=3)
+    recorder = RecordingClient(delay=0.01)
+    service.client.request = recorder.request
+
+    await asyncio.gather(*(
+        service.call_endpoint("quote", query_params={"instrument_key": f"NSE_S{i}"}) for i in range(12)
+    ))
+
+    assert len(recorder.calls) == 12
+    assert recorder.peak == 3
+    await service.close()
+
+
+async def test_concurrency_limit_can_be_disabled():
+    """enable_concurrency_limit=False lets every request run at once"""
+    service = await make_service(max_inflight=2, enable_concurrency_limit=False)
+    recorder = RecordingClient(delay=0.01)
+    service.client.request = recorder.request
+
+    await asyncio.gather(*(
+        service.call_endpoint("quote", query_params={"instrument_key": f"NSE_S{i}"}) for i in range(6)
+    ))
+
+    assert recorder.peak == 6
+    assert service._get_inflight_semaphore() is None
+    await service.close()
+
+
+async def test_call_endpoint_builds_request_from_template():
+    """Per-call fields overlay the endpoint template and kwargs override both"""
+    service = await make_service()
+    recorder = RecordingClient()
+    service.client.request = recorder.request
+
+    await service.call_endpoint("market_status", path_params={"segment": "NSE_EQ"})
+    await service.call_endpoint("quote", query_params={"instrument_key": "NSE_X"}, cache_ttl=0)
+
+    assert recorder.calls[0] == {
+        "method": "GET",
+        "endpoint": "market-quote/market-status/NSE_EQ",
+        "params": None,
+        "json_data": None,
+        "use_cache": True,
+        "cache_ttl": 60,
+    }
+    assert recorder.calls[1]["cache_ttl"] == 0
+    assert recorder.calls[1]["params"] == {"instrument_key": "NSE_X"}
+    # The shared template is never mutated by a call
+    assert service.get_service_endpoints()["quote"].request_template["cache_ttl"] == 1
+    await service.close()
+
+
+async def test_apply_auth_dispatches_each_scheme():
+    """_apply_auth routes every scheme to its handler and skips empty values"""
+    service = await make_service()
+    headers = {}
+
+    service._apply_auth(headers, {
+        "basic": ("user", "pass"),
+        "api_key": ("X-Key", "abc"),
+        "header": {"X-Session": "s1", "X-Empty": ""},
+        "bearer": None,
+    })
+
+    assert headers == {
+        "Authorization": "Basic dXNlcjpwYXNz",
+        "X-Key": "abc",
+        "X-Session": "s1",
+    }
+    await service.close()
+
+
+async def test_upstox_authentication_headers():
+    """Upstox sets bearer and API key headers from config"""
+    service = await make_service(access_token="tok", api_key="key")
+
+    assert service.client.default_headers["Authorization"] == "Bearer tok"
+    assert service.client.default_headers["X-API-Key"] == "key"
+    await service.close()
+
+
+async def test_cache_key_varies_by_authorization():
+    """Cached responses are namespaced per Authorization header"""
+    alice = await make_service(access_token="alice")
+    bob = await make_service(access_token="bob")
+    url = "https://api.upstox.com/market-quote/quotes"
+    params = {"instrument_key": "NSE_X"}
+
+    def key_for(service):
+        credentials = _credential_headers(service.client.default_headers)
+        return service.client._generate_cache_key("GET", url, params, credentials)
+
+    assert key_for(alice) != key_for(bob)
+    assert key_for(alice) == key_for(alice)
+    # Public requests keep the plain key
+    assert alice.client._generate_cache_key("GET", url, params) == (
+        f"GET:{url}:{sorted(params.items())}"
+    )
+    await alice.close()
+    await bob.close()
+
+
+async def test_cache_key_varies_by_session_and_market_tokens():
+    """Groww session tokens and XTS market tokens namespace cached responses too"""
+    url = "https://example.com/quote"
+
+    def key_for(service):
+        credentials = _credential_headers(service.client.default_headers)
+        return service.client._generate_cache_key("GET", url, None, credentials)
+
+    groww_a, groww_b = GrowwService(session_token="a"), GrowwService(session_token="b")
+    xts_a, xts_b = XTSService(), XTSService()
+    xts_a.client.default_headers["x-market-token"] = "a"
+    xts_b.client.default_headers["x-market-token"] = "b"
+
+    assert key_for(groww_a) != key_for(groww_b)
+    assert key_for(xts_a) != key_for(xts_b)
+    for service in (groww_a, groww_b, xts_a, xts_b):
+        await service.close()
+
+
+async def test_services_can_share_a_connection_pool():
+    """share_connection_pool reuses one connector per host across instances"""
+    first = await make_service(share_connection_pool=True)
+    second = await make_service(share_connection_pool=True)
+    private = await make_service()
+    other_host = XTSService(share_connection_pool=True)
+
+    assert first.client._connector is second.client._connector
+    assert private.client._connector is not first.client._connector
+    assert other_host.client._connector is not first.client._connector
+
+    await first.close()
+    assert not second.client._connector.closed
+
+    await close_shared_connectors()
+    assert second.client._connector.closed
+    for service in (second, private, other_host):
+        await service.close()
+
+
+async def test_xts_source_is_cached_and_updatable():
+    """XTS reads its request source once and set_source keeps every use in sync"""
+    service = XTSService(source="MobileAPI")
+    recorder = RecordingClient()
+    service.client.request = recorder.request
+
+    assert service.client.default_headers["source"] == "MobileAPI"
+    service.set_source("WebAPI")
+    await service.search_instruments("RELIANCE")
+
+    assert service.config["source"] == "WebAPI"
+    assert service.client.default_headers["source"] == "WebAPI"
+    assert recorder.calls[0]["params"]["source"] == "WebAPI"
+    await service.close()
+
+
+@pytest.mark.parametrize("login, endpoint, token_attr, flag_attr, header", [
+    ("login_interactive", "/user/session", "interactive_token", "is_interactive_logged_in", "authorization"),
+    ("login_market", "https://developers.symphonyfintech.in/marketdata/apimarketdata/auth/login",
+     "market_token", "is_market_logged_in", "x-market-token"),
+])
+async def test_xts_login_stores_token(login, endpoint, token_attr, flag_attr, header):
+    """Each XTS login posts credentials and stores its own session token"""
+    service = XTSService(user_id="u1", password="pw")
+    calls = []
+
+    async def request(**kwargs):
+        calls.append(kwargs)
+        return {"token": "tok"}
+
+    service.client.request = request
+    response = await getattr(service, login)(public_key="pub")
+
+    assert response == {"token": "tok"}
+    assert calls[0]["endpoint"] == endpoint
+    assert calls[0]["json_data"] == {
+        "userId": "u1", "password": "pw", "publicKey": "pub", "privateKey": None, "source": "WebAPI",
+    }
+    assert getattr(service, token_attr) == "tok"
+    assert getattr(service, flag_attr) is True
+    assert service.client.default_headers[header] == "tok"
+    await service.close()
+
+
+async def test_groww_default_config_is_shared_read_only():
+    """Groww instances copy the import-time default config instead of mutating it"""
+    service = GrowwService(timeout=1)
+
+    assert service.config["timeout"] == 1
+    assert service.get_default_config()["timeout"] == 5
+    with pytest.raises(TypeError):
+        service.get_default_config()["timeout"] = 1
+    await service.close()
+
+
+async def test_groww_config_endpoints_do_not_leak_into_class_table():
+    """Config-supplied Groww endpoints stay on the instance that loaded them"""
+    service = GrowwService()
+
+    assert "sector_data" in service.get_service_endpoints()
+    assert "sector_data" not in GrowwService._ENDPOINTS
+    with pytest.raises(TypeError):
+        GrowwService._ENDPOINTS["extra"] = EndpointConfig(path="x")
+    await service.close()
+
+
+async def test_upstox_config_endpoints_do_not_leak_into_class_table():
+    """Upstox config endpoints are overlaid on a per-instance copy"""
+    service = await make_service()
+
+    assert "custom_portfolio" in service.get_service_endpoints()
+    assert "custom_portfolio" not in UpstoxService._ENDPOINTS
+    await service.close()
+
+
+async def test_xts_endpoint_table_is_built_once():
+    """XTS shares one merged endpoint table and routes market endpoints from it"""
+    service = XTSService()
+
+    assert service.get_service_endpoints() is XTSService._ENDPOINTS
+    assert "order.place" in XTSService._ENDPOINTS
+    assert "market.instruments.quotes" in XTSService._MARKET_ENDPOINT_NAMES
+    assert "order.place" not in XTSService._MARKET_ENDPOINT_NAMES
+    await service.close()
+
+
+async def test_xts_custom_market_endpoints_are_routed_per_instance():
+    """Config-supplied market.* endpoints use the market base URL on that instance only"""
+    service = XTSService(config={"endpoints": {"market.depth": {"path": "/apimarketdata/depth"}}})
+
+    assert "market.depth" in service._MARKET_ENDPOINT_NAMES
+    assert "market.depth" not in XTSService._MARKET_ENDPOINT_NAMES
+    assert "market.depth" not in XTSService._ENDPOINTS
+    await service.close()
+
+
+async def test_xts_market_calls_do_not_touch_client_base_url():
+    """Concurrent market and interactive calls each resolve their own base URL"""
+    service = XTSService()
+    recorder = RecordingClient(delay=0.01)
+    service.client.request = recorder.request
+    base_url = service.client.base_url
+
+    await asyncio.gather(
+        service.get_quotes("NSE:1"),
+        service.call_endpoint("orders"),
+    )
+
+    assert service.client.base_url == base_url
+    assert recorder.calls[0]["endpoint"] == (
+        "https://developers.symphonyfintech.in/marketdata/apimarketdata/instruments/quotes"
+    )
+    assert recorder.calls[1]["endpoint"] == "/orders"
+    await service.close()
+
+
+async def test_groww_authentication_headers():
+    """Groww merges session, user agent and custom auth headers"""
+    service = GrowwService(
+        session_token="sess",
+        auth_headers={"X-Session-Token": "", "Cookie": "c=1"},
+    )
+    headers = service.client.default_headers
+
+    assert headers["X-Session-Token"] == "sess"
+    assert headers["Cookie"] == "c=1"
+    await service.close()
+
+
+@pytest.mark.parametrize("auth, expected", [
+    ({"type": "bearer", "token": "t"}, {"Authorization": "Bearer t"}),
+    ({"type": "api_key", "key": "k", "header_name": "X-Key"}, {"X-Key": "k"}),
+    ({"type": "basic", "username": "user", "password": "pass"},
+     {"Authorization": "Basic dXNlcjpwYXNz"}),
+    ({"type": "basic", "username": "jöran", "password": "päss"},
+     {"Authorization": "Basic asO2cmFuOnDDpHNz"}),
+    ({"type": "custom", "headers": {"X-A": "1"}}, {"X-A": "1"}),
+    ({"type": "none"}, {}),
+])
+def test_custom_service_auth_types(auth, expected):
+    """CustomAPIService maps each configured auth type to its headers"""
+    service = CustomAPIService.__new__(CustomAPIService)
+    service.config = {"auth": auth}
+    headers = {}
+
+    service._apply_authentication(headers)
+
+    assert headers == expected
+
+
+async def test_custom_service_without_parameter_mapper():
+    """Services whose broker has no parameter mapper still initialise"""
+    service = CustomAPIService(base_url="https://example.com", endpoints={"ping": {"path": "/ping"}})
+
+    assert service._endpoint_executor.parameter_transformer is None
+    assert "ping" in service.get_service_endpoints()
+    await service.close()
+
+
+def test_custom_endpoint_configs_are_shared():
+    """Identical custom endpoint definitions resolve to one frozen EndpointConfig"""
+    first = _endpoint_config("/v1/data", "GET", 30, True, "Data")
+    second = _endpoint_config("/v1/data", "GET", 30, True, "Data")
+
+    assert first is second
+    assert _endpoint_config("/v1/data", "POST", 30, True, "Data") is not first
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.cache_ttl = 0
+
+
+@pytest.mark.parametrize("endpoints", [
+    {"no_path": {"method": "GET"}},
+    {"bad_ttl": {"path": "/x", "cache_ttl": "60"}},
+    {"not_a_dict": "/x"},
+    {"none_path": {"path": None}},
+    {"empty_path": {"path": ""}},
+])
+def test_malformed_custom_endpoints_are_rejected(endpoints):
+    """Custom endpoint definitions are validated before any service setup"""
+    with pytest.raises(ValueError):
+        _validate_endpoints(endpoints)
+
+
+def test_custom_endpoints_accept_numeric_ttl_and_flag():
+    """Fractional TTLs and 0/1 cache flags stay valid"""
+    _validate_endpoints({"quote": {"path": "/q", "cache_ttl": 0.5, "use_cache": 1}})
+
+
+@pytest.mark.parametrize("path, params", [
+    ("market-quote/market-status/{segment}", {"segment": "NSE_EQ"}),
+    ("a/{x}/b/{y}/c", {"x": 1, "y": "two"}),
+    ("orders/{{literal}}/{order_id}", {"order_id": "42"}),
+    ("history/{day:02d}", {"day": 7}),
+    ("static/path", {"unused": "x"}),
+])
+def test_format_path_matches_str_format(path, params):
+    """Precompiled path substitution gives the same result as str.format"""
+    assert EndpointConfig(path=path).format_path(params) == path.format(**params)
+
+
+def test_format_path_reports_missing_params():
+    """Missing path parameters still raise KeyError"""
+    with pytest.raises(KeyError):
+        EndpointConfig(path="orders/{order_id}").format_path({"other": 1})
+
+
+def test_json_bodies_encode_decimal_prices():
+    """Request bodies serialize Decimal prices as JSON numbers"""
+    body = _json_dumps({"price": Decimal("2500.50"), "quantity": 1})
+
+    assert json.loads(body) == {"price": 2500.5, "quantity": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+Tests for RequestBatcher and batched Upstox quotes
+"""
+
+import asyncio
+
+import pytest
+
+from src.network_test.services.batching import RequestBatcher
+from src.network_test.services.upstox_service import UpstoxService
+
+
+class RecordingFetcher:
+    """Batch fetcher that records each batch and echoes keys back"""
+
+    def __init__(self, error: Exception = None):
+        self.batches = []
+        self.error = error
+
+    async def __call__(self, keys):
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        return {key: f"value:{key}" for key in keys if key != "missing"}
+
+
+async def test_concurrent_gets_share_one_fetch():
+    """Lookups within the batch window go out as a single call"""
+    fetch = RecordingFetcher()
+    batcher = RequestBatcher(fetch, batch_interval_ms=5)
+
+    results = await asyncio.gather(*(batcher.get(key) for key in ["a", "b", "a", "missing"]))
+
+    assert results == ["value:a", "value:b", "value:a", None]
+    assert fetch.batches == [["a", "b", "missing"]]
+
+
+async def test_full_batch_is_sent_immediately():
+    """Reaching max_batch_size flushes without waiting for the timer"""
+    fetch = RecordingFetcher()
+    batcher = RequestBatcher(fetch, batch_interval_ms=10_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.get(key) for key in "abcd")), timeout=1
+    )
+
+    assert results == ["value:a", "value:b", "value:c", "value:d"]
+    assert fetch.batches == [["a", "b"], ["c", "d"]]
+
+
+async def test_fetch_errors_reach_every_caller():
+    """A failed batch raises in each waiting caller"""
+    batcher = RequestBatcher(RecordingFetcher(error=RuntimeError("down")), batch_interval_ms=1)
+
+    results = await asyncio.gather(batcher.get("a"), batcher.get("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_rejects_empty_batches():
+    with pytest.raises(ValueError):
+        RequestBatcher(RecordingFetcher(), max_batch_size=0)
+
+
+async def test_upstox_batches_concurrent_quotes():
+    """Batched get_quote splits one multi-instrument response per caller"""
+    service = UpstoxService(enable_quote_batching=True)
+    calls = []
+
+    async def request(**kwargs):
+        calls.append(kwargs)
+        return {"status": "success", "data": {
+            "NSE_EQ:A": {"instrument_token": "NSE_EQ|A", "last_price": 1},
+            "NSE_EQ:B": {"instrument_token": "NSE_EQ|B", "last_price": 2},
+        }}
+
+    service.client.request = request
+
+    quote_a, quote_b = await asyncio.gather(
+        service.get_quote("NSE_EQ|A"), service.get_quote("NSE_EQ|B")
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["params"] == {"instrument_key": "NSE_EQ|A,NSE_EQ|B"}
+    assert quote_a == {"status": "success", "data": {
+        "NSE_EQ:A": {"instrument_token": "NSE_EQ|A", "last_price": 1},
+    }}
+    assert quote_b["data"]["NSE_EQ:B"]["last_price"] == 2
+    await service.close()
+
+
+async def test_upstox_batched_error_reaches_every_caller():
+    """A failed batched quote returns the broker's error to each caller"""
+    service = UpstoxService(enable_quote_batching=True)
+    error = {"status": "error", "errors": [{"errorCode": "UDAPI100011", "message": "Invalid key"}]}
+
+    async def request(**kwargs):
+        return error
+
+    service.client.request = request
+
+    quote_a, quote_b = await asyncio.gather(
+        service.get_quote("NSE_EQ|A"), service.get_quote("NSE_EQ|B")
+    )
+
+    assert quote_a == error
+    assert quote_b == error
+    await service.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
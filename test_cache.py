@@ -0,0 +1,38 @@
+"""
+Tests for AsyncCache expiry and LRU eviction
+"""
+
+import pytest
+
+from src.network_test.network import AsyncCache
+
+
+async def test_least_recently_used_entry_is_evicted():
+    """Once full, the cache drops the entry used longest ago"""
+    cache = AsyncCache(default_ttl=60, max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    assert await cache.get("a") == 1  # "b" is now the oldest use
+    await cache.set("c", 3)
+
+    assert cache.size() == 2
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+async def test_overwriting_a_key_does_not_evict():
+    """Re-setting an existing key refreshes it without growing the cache"""
+    cache = AsyncCache(default_ttl=60, max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.set("a", 10)
+
+    assert cache.size() == 2
+    assert await cache.get("a") == 10
+    assert await cache.get("b") == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
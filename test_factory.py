@@ -0,0 +1,68 @@
+"""
+Tests for ServiceFactory registration and lookup
+"""
+
+import pytest
+
+from src.network_test.services.factory import ServiceFactory
+from src.network_test.services.upstox_service import UpstoxService
+
+
+@pytest.fixture
+def restore_registry():
+    """Undo any registrations a test makes"""
+    registry = dict(ServiceFactory._SERVICE_REGISTRY)
+    yield
+    ServiceFactory._SERVICE_REGISTRY.clear()
+    ServiceFactory._SERVICE_REGISTRY.update(registry)
+    ServiceFactory._SERVICE_KEYS = frozenset(registry)
+    ServiceFactory._SERVICE_KEYS_STR = ", ".join(sorted(registry))
+    ServiceFactory._AVAILABLE_CACHE = None
+
+
+def test_unknown_service_lists_available_types():
+    """Unsupported service types report every registered type"""
+    with pytest.raises(ValueError, match="Available types: custom, groww, upstox, xts"):
+        ServiceFactory.create_service("unknown")
+
+
+def test_available_services_is_cached_read_only_view():
+    """get_available_services returns the same read-only mapping each time"""
+    services = ServiceFactory.get_available_services()
+
+    assert ServiceFactory.get_available_services() is services
+    assert services["xts"] == "XTS (Symphony Fintech) trading platform integration"
+    with pytest.raises(TypeError):
+        services["new"] = "x"
+
+
+def test_register_service_updates_lookups(restore_registry):
+    """A newly registered service is immediately available"""
+    assert not ServiceFactory.is_service_available("upstox_v3")
+
+    ServiceFactory.register_service("upstox_v3", UpstoxService)
+
+    assert ServiceFactory.is_service_available("upstox_v3")
+    assert "upstox_v3" in ServiceFactory.get_available_services()
+    with pytest.raises(ValueError, match="upstox_v3"):
+        ServiceFactory.create_service("unknown")
+
+
+def test_register_service_rejects_non_services(restore_registry):
+    """Only ITradingService implementations can be registered"""
+    with pytest.raises(TypeError):
+        ServiceFactory.register_service("bogus", dict)
+    assert not ServiceFactory.is_service_available("bogus")
+
+
+def test_reregistering_same_class_is_noop(restore_registry):
+    """Registering an already-registered class leaves the lookup snapshot untouched"""
+    keys = ServiceFactory._SERVICE_KEYS
+
+    ServiceFactory.register_service("upstox", UpstoxService)
+
+    assert ServiceFactory._SERVICE_KEYS is keys
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
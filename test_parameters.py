@@ -7,6 +7,8 @@ broker-specific formats.
 """
 
 # import pytest  # Comment out for basic testing
+import json
+from dataclasses import fields
 from decimal import Decimal
 
 from network_test.services.parameters import (GrowwParameterMapper, OrderSide,
@@ -81,6 +83,42 @@ class TestStandardOrderParams:
         assert params.extras["custom_field"] == "value"
         assert params.extras["broker_specific"] is True
 
+    def test_order_params_to_dict_copies_extras(self):
+        """to_dict covers every field and never shares the extras dict"""
+        params = StandardOrderParams(
+            symbol="INFY",
+            exchange="NSE",
+            quantity=1,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            product_type=ProductType.INTRADAY,
+            extras={"custom_field": "value"}
+        )
+
+        result = params.to_dict()
+        result["extras"]["custom_field"] = "changed"
+
+        assert list(result) == [f.name for f in fields(StandardOrderParams)]
+        assert result["validity"] == "DAY"
+        assert params.extras["custom_field"] == "value"
+
+    def test_order_params_to_dict_accepts_plain_strings(self):
+        """to_dict works when enum fields were given as plain strings"""
+        params = StandardOrderParams(
+            symbol="INFY",
+            exchange="NSE",
+            quantity=1,
+            order_side="BUY",
+            order_type="MARKET",
+            product_type="DELIVERY"
+        )
+
+        result = params.to_dict()
+
+        assert result["order_side"] == "BUY"
+        assert result["product_type"] == "DELIVERY"
+        assert result["validity"] == "DAY"
+
 
 class TestUpstoxParameterMapper:
     """Test Upstox parameter mapping"""
@@ -259,6 +297,48 @@ class TestGrowwParameterMapper:
         assert result["orderType"] == "limit"  # Lowercase
 
 
+def test_order_enums_are_plain_strings():
+    """Order enum members compare equal to, and format as, their values"""
+    assert OrderSide.BUY == "BUY"
+    assert f"{OrderType.STOP_LOSS}" == "STOP_LOSS"
+    assert ProductType("DELIVERY") is ProductType.DELIVERY
+    assert Validity.IOC.lower() == "ioc"
+
+
+def test_order_mappers_cover_every_enum_member():
+    """Order mapper lookups agree with the public enum maps"""
+    for mapper in (UpstoxParameterMapper(), XTSParameterMapper()):
+        for side in OrderSide:
+            for order_type in OrderType:
+                for product_type in ProductType:
+                    for validity in Validity:
+                        params = StandardOrderParams(
+                            symbol="TCS", exchange="NSE", quantity=1,
+                            order_side=side, order_type=order_type,
+                            product_type=product_type, validity=validity
+                        )
+                        mapped = mapper.map_order_params(params)
+                        assert mapper.PRODUCT_TYPE_MAP[product_type] in mapped.values()
+                        assert mapper.ORDER_TYPE_MAP[order_type] in mapped.values()
+                        assert mapper.ORDER_SIDE_MAP[side] in mapped.values()
+                        assert mapper.VALIDITY_MAP[validity] in mapped.values()
+
+
+def test_order_mappers_accept_plain_string_enum_values():
+    """StrEnum fields may be given as their plain string values"""
+    params = StandardOrderParams(
+        symbol="TCS", exchange="NSE", quantity=1,
+        order_side="SELL", order_type="STOP_LOSS", product_type="DELIVERY", validity="IOC"
+    )
+
+    upstox = UpstoxParameterMapper().map_order_params(params)
+    xts = XTSParameterMapper().map_order_params(params)
+
+    assert (upstox["transaction_type"], upstox["order_type"], upstox["product"]) == ("SELL", "SL", "D")
+    assert (xts["orderSide"], xts["orderType"], xts["productType"]) == ("SELL", "STOPLOSS", "CNC")
+    assert xts["timeInForce"] == "IOC"
+
+
 class TestParameterMapperFactory:
     """Test ParameterMapperFactory functionality"""
 
@@ -362,6 +442,38 @@ class TestParameterValidation:
         assert params.price == Decimal("2500.75")
         assert params.trigger_price == Decimal("2400.25")
 
+    def test_float_prices_become_decimal(self):
+        """Float prices are converted to Decimal once, without binary noise"""
+        params = StandardOrderParams(
+            symbol="RELIANCE",
+            exchange="NSE",
+            quantity=1,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.STOP_LOSS,
+            product_type=ProductType.INTRADAY,
+            price=2500.1,
+            trigger_price=2400
+        )
+
+        assert params.price == Decimal("2500.1")
+        assert params.trigger_price == Decimal("2400")
+        assert UpstoxParameterMapper().map_order_params(params)["price"] == 2500.1
+
+    def test_to_dict_is_json_serializable(self):
+        """Decimal prices come out of to_dict as plain floats"""
+        params = StandardOrderParams(
+            symbol="RELIANCE",
+            exchange="NSE",
+            quantity=1,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            product_type=ProductType.INTRADAY,
+            price=Decimal("2500.50")
+        )
+
+        assert json.loads(json.dumps(params.to_dict()))["price"] == 2500.5
+        assert params.to_dict()["trigger_price"] is None
+
 
 def test_end_to_end_mapping():
     """Test complete end-to-end parameter mapping"""
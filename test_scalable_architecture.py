@@ -6,16 +6,26 @@ architecture for trading services with standardized parameters.
 """
 
 import asyncio
+import inspect
+import json
+from decimal import Decimal
 
 import pytest
 
+from src.network_test.network import _json_dumps
+
 from src.network_test.services.broker_configurations import (
-    initialize_scalable_architecture, upstox_order_transformer,
-    validate_order_params, validate_quote_params, xts_order_transformer)
+    BrokerConfigurationRegistry, MappingBasedTransformer, UpstoxMappings,
+    initialize_scalable_architecture, register_global_schemas, upstox_order_transformer,
+    upstox_quote_transformer, validate_order_params, validate_quote_params, xts_order_transformer)
+from src.network_test.services.parameters import (OrderSide, OrderType, ProductType,
+                                                  StandardOrderParams)
 from src.network_test.services.scalable_architecture import (
     BrokerConfigurationBuilder, BrokerEndpointMapping, BrokerMappingRegistry,
-    EndpointCategory, OperationType, ParameterSchema,
-    ParameterSchemaRegistry, StandardResponse)
+    EndpointCategory, EndpointExecutor, OperationType, ParameterSchema,
+    ParameterSchemaRegistry, StandardizedOperationsMixin, StandardResponse,
+    TransformationPipeline)
+from src.network_test.services.upstox_service import UpstoxService
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -40,16 +50,58 @@ class TestParameterSchemaRegistry:
             description="Test order schema"
         )
 
-        # Register it
+        # Register it (registered schemas are kept, so put the global one back after)
+        global_schema = ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER)
         ParameterSchemaRegistry.register_schema(test_schema)
 
-        # Retrieve and verify
-        retrieved_schema = ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER)
-        assert retrieved_schema is not None
-        assert retrieved_schema.operation == OperationType.PLACE_ORDER
-        assert 'symbol' in retrieved_schema.required_fields
-        assert 'quantity' in retrieved_schema.required_fields
-        assert 'price' in retrieved_schema.optional_fields
+        try:
+            # Retrieve and verify
+            retrieved_schema = ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER)
+            assert retrieved_schema is not None
+            assert retrieved_schema.operation == OperationType.PLACE_ORDER
+            assert 'symbol' in retrieved_schema.required_fields
+            assert 'quantity' in retrieved_schema.required_fields
+            assert 'price' in retrieved_schema.optional_fields
+        finally:
+            ParameterSchemaRegistry.register_schema(global_schema)
+
+    def test_global_schemas_are_shared_and_keep_custom_schemas(self):
+        """register_global_schemas reuses one schema object and never replaces a caller's"""
+        register_global_schemas()
+        order_schema = ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER)
+
+        register_global_schemas()
+        assert ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER) is order_schema
+
+        custom_schema = ParameterSchema(
+            operation=OperationType.PLACE_ORDER,
+            category=EndpointCategory.ORDERS,
+            required_fields=['symbol']
+        )
+        ParameterSchemaRegistry.register_schema(custom_schema)
+        BrokerConfigurationRegistry.reset()
+        try:
+            register_global_schemas()
+            BrokerConfigurationRegistry.ensure_configured('xts')
+            assert ParameterSchemaRegistry.get_schema(OperationType.PLACE_ORDER) is custom_schema
+        finally:
+            ParameterSchemaRegistry.register_schema(order_schema)
+            BrokerConfigurationRegistry.configure_all_brokers()
+
+    def test_missing_fields_reported_in_declared_order(self):
+        """Every missing required field is reported, in schema order"""
+        schema = ParameterSchema(
+            operation=OperationType.GET_CANDLES,
+            category=EndpointCategory.HISTORICAL,
+            required_fields=('symbol', 'exchange', 'interval')
+        )
+
+        assert schema.validate({'symbol': 'TCS', 'interval': '1d'}) == ["Missing required field: exchange"]
+        assert schema.validate({}) == [
+            "Missing required field: symbol",
+            "Missing required field: exchange",
+            "Missing required field: interval",
+        ]
 
     def test_parameter_validation_success(self):
         """Test successful parameter validation"""
@@ -141,6 +193,113 @@ class TestBrokerMappingRegistry:
         assert "xts" in brokers
         assert "groww" in brokers
 
+    def test_list_brokers_view_tracks_registrations(self):
+        """The cached broker list is reused until a broker is added or removed"""
+        brokers = BrokerMappingRegistry.list_brokers()
+        assert BrokerMappingRegistry.list_brokers() is brokers
+
+        BrokerMappingRegistry.register_broker_mapping('view_broker', BrokerEndpointMapping(
+            operation=OperationType.GET_PROFILE,
+            broker_endpoint_name='profile'
+        ))
+        try:
+            assert 'view_broker' in BrokerMappingRegistry.list_brokers()
+        finally:
+            BrokerMappingRegistry.unregister_broker('view_broker')
+        assert 'view_broker' not in BrokerMappingRegistry.list_brokers()
+
+
+class TestBrokerConfigurationRegistry:
+    """Test broker configuration registry behaviour"""
+
+    def test_configure_all_brokers_runs_each_config_once(self):
+        """Repeated configure_all_brokers calls skip already-configured brokers"""
+        calls = []
+        BrokerConfigurationRegistry.register_configuration('counting_broker', lambda: calls.append(1))
+        try:
+            BrokerConfigurationRegistry.configure_all_brokers()
+            BrokerConfigurationRegistry.configure_all_brokers()
+            BrokerConfigurationRegistry.configure_broker('counting_broker')
+            assert len(calls) == 1
+
+            BrokerConfigurationRegistry.reset()
+            BrokerConfigurationRegistry.configure_broker('counting_broker')
+            assert len(calls) == 2
+        finally:
+            BrokerConfigurationRegistry._configurations.pop('counting_broker', None)
+            BrokerMappingRegistry._loaders.pop('counting_broker', None)
+            BrokerConfigurationRegistry.configure_all_brokers()
+
+    def test_broker_is_configured_on_first_lookup(self):
+        """Mapping lookups configure a registered broker the first time it is used"""
+        calls = []
+
+        def configure_lazy_broker():
+            calls.append(1)
+            BrokerMappingRegistry.register_broker_mapping('lazy_broker', BrokerEndpointMapping(
+                operation=OperationType.GET_PROFILE,
+                broker_endpoint_name='profile'
+            ))
+
+        BrokerConfigurationRegistry.register_configuration('lazy_broker', configure_lazy_broker)
+        try:
+            assert calls == []
+            assert BrokerMappingRegistry.get_supported_operations('lazy_broker') == [OperationType.GET_PROFILE]
+            assert BrokerMappingRegistry.get_mapping('lazy_broker', OperationType.GET_PROFILE) is not None
+            assert len(calls) == 1
+        finally:
+            BrokerConfigurationRegistry._configurations.pop('lazy_broker', None)
+            BrokerConfigurationRegistry.reset()
+            BrokerMappingRegistry.unregister_broker('lazy_broker')
+            BrokerConfigurationRegistry.configure_all_brokers()
+
+
+class TestStandardResponse:
+    """Test standardized response serialization"""
+
+    def test_to_json_dict_skips_empty_and_raw_fields(self):
+        """to_json_dict omits None fields and raw payloads by default"""
+        raw = {'status': 'success', 'data': {'order_id': '1'}}
+        response = StandardResponse(
+            success=True,
+            data={'order_id': '1'},
+            raw_response=raw,
+            broker_name='upstox',
+            operation=OperationType.PLACE_ORDER
+        )
+
+        assert response.to_json_dict() == {
+            'success': True,
+            'data': {'order_id': '1'},
+            'broker_name': 'upstox',
+            'operation': 'place_order',
+        }
+        assert response.to_json_dict(include_raw=True)['raw_response'] is raw
+
+
+class TestTransformationPipeline:
+    """Test parameter transformation pipelines"""
+
+    def test_pipeline_copies_input_by_default(self):
+        """Default pipelines never hand stages the caller's dict"""
+        params = {'a': 1}
+        pipeline = TransformationPipeline()
+        pipeline.add_stage(lambda p: p.update(b=2) or p)
+
+        assert pipeline.execute(params) == {'a': 1, 'b': 2}
+        assert params == {'a': 1}
+
+    def test_pipeline_without_input_copy(self):
+        """Pure pipelines can skip the defensive copy"""
+        params = {'a': 1}
+        pipeline = TransformationPipeline(copy_input=False)
+
+        assert pipeline.execute(params) is params
+
+        pipeline.add_stage(lambda p: {**p, 'b': 2})
+        assert pipeline.execute(params) == {'a': 1, 'b': 2}
+        assert params == {'a': 1}
+
 
 class TestParameterTransformers:
     """Test parameter transformation functions"""
@@ -229,6 +388,49 @@ class TestParameterTransformers:
             result = xts_order_transformer(params)
             assert result['exchangeSegment'] == expected_segment
 
+    def test_upstox_quote_transformer(self):
+        """Test Upstox quote instrument keys are exchange-prefixed"""
+        result = upstox_quote_transformer({'symbols': ['RELIANCE', 'TCS'], 'exchange': 'BSE'})
+        assert result == {'instrument_key': 'BSE_RELIANCE,BSE_TCS'}
+
+        result = upstox_quote_transformer({'symbols': ['INFY']})
+        assert result == {'instrument_key': 'NSE_INFY'}
+
+        result = upstox_quote_transformer({'symbols': [500325, 'TCS'], 'exchange': 'BSE'})
+        assert result == {'instrument_key': 'BSE_500325,BSE_TCS'}
+
+    def test_transformers_are_idempotent(self):
+        """Re-transforming a broker-native payload leaves it unchanged"""
+        standard_params = {
+            'symbol': 'RELIANCE',
+            'exchange': 'NSE',
+            'quantity': 10,
+            'order_side': 'BUY',
+            'order_type': 'STOP_LOSS',
+            'product_type': 'INTRADAY',
+            'instrument_id': 26000
+        }
+
+        for transformer in (upstox_order_transformer, xts_order_transformer):
+            native = transformer(standard_params)
+            replayed = transformer(native)
+            assert replayed == native
+            assert replayed is not native
+
+    def test_partial_standard_payload_is_mapped(self):
+        """Fields that keep their name still get their values mapped"""
+        class ProductOnlyMappings:
+            PRODUCT_TYPE_MAP = {'INTRADAY': 'I'}
+
+        upstox = MappingBasedTransformer(UpstoxMappings)
+        assert upstox.transform({'order_type': 'STOP_LOSS', 'quantity': 1}) == {
+            'order_type': 'SL', 'quantity': 1
+        }
+        assert upstox_order_transformer({'order_type': 'STOP_LOSS_MARKET'})['order_type'] == 'SL-M'
+        assert MappingBasedTransformer(ProductOnlyMappings).transform(
+            {'product_type': 'INTRADAY'}
+        ) == {'product_type': 'I'}
+
 
 class TestValidationRules:
     """Test custom validation rules"""
@@ -488,6 +690,146 @@ class TestAsyncOperations:
 
         print("✅ Simulated async execution completed successfully")
 
+    async def test_executor_sends_get_params_as_query_and_others_as_body(self):
+        """GET mappings pass params through; other verbs wrap them as json_data"""
+        calls = []
+
+        class RecordingService:
+            async def call_endpoint(self, endpoint_name, **kwargs):
+                calls.append((endpoint_name, kwargs))
+                return {}
+
+        executor = EndpointExecutor('dispatch_broker')
+        for method in ('GET', 'POST'):
+            BrokerMappingRegistry.register_broker_mapping('dispatch_broker', BrokerEndpointMapping(
+                operation=OperationType.GET_POSITIONS,
+                broker_endpoint_name=f'positions_{method.lower()}',
+                http_method=method
+            ))
+            try:
+                response = await executor.execute_operation(
+                    OperationType.GET_POSITIONS, {'account_id': 'A1'}, RecordingService()
+                )
+            finally:
+                BrokerMappingRegistry.unregister_broker('dispatch_broker')
+            assert response.success is True
+
+        assert calls == [
+            ('positions_get', {'account_id': 'A1'}),
+            ('positions_post', {'json_data': {'account_id': 'A1'}}),
+        ]
+
+    async def test_standard_operation_methods_dispatch_to_executor(self):
+        """Standardized operation methods route through the endpoint executor"""
+        calls = []
+
+        class DemoService(StandardizedOperationsMixin):
+            async def call_endpoint(self, endpoint_name, **kwargs):
+                calls.append((endpoint_name, kwargs))
+                return {'positions': []}
+
+        service = DemoService()
+        service._endpoint_executor = EndpointExecutor('mixin_broker')
+        BrokerMappingRegistry.register_broker_mapping('mixin_broker', BrokerEndpointMapping(
+            operation=OperationType.GET_POSITIONS,
+            broker_endpoint_name='positions'
+        ))
+        try:
+            response = await service.get_positions_standard(account_id='A1')
+        finally:
+            BrokerMappingRegistry.unregister_broker('mixin_broker')
+
+        assert response.success is True
+        assert response.data == {'positions': []}
+        assert calls == [('positions', {'account_id': 'A1'})]
+        assert inspect.iscoroutinefunction(service.get_positions_standard)
+
+    async def test_service_standard_operations_work_from_fresh_registry(self):
+        """A directly constructed service configures its broker before validating"""
+        schemas = dict(ParameterSchemaRegistry._schemas)
+        ParameterSchemaRegistry._schemas.clear()
+        ParameterSchemaRegistry._operations_view = None
+        BrokerMappingRegistry.unregister_broker('upstox')
+        BrokerConfigurationRegistry.reset()
+        try:
+            service = UpstoxService()
+            calls = []
+
+            async def request(**kwargs):
+                calls.append(kwargs)
+                return {'status': 'success', 'data': []}
+
+            service.client.request = request
+            response = await service.get_positions_standard()
+            await service.close()
+        finally:
+            ParameterSchemaRegistry._schemas.update(schemas)
+            ParameterSchemaRegistry._operations_view = None
+            BrokerConfigurationRegistry.configure_all_brokers()
+
+        assert response.success is True, response.error
+        assert len(calls) == 1
+
+    async def test_place_orders_standard_submits_concurrently(self):
+        """Bulk order placement runs every order and keeps response order"""
+        in_flight = []
+        peak = []
+
+        class DemoService(StandardizedOperationsMixin):
+            async def call_endpoint(self, endpoint_name, json_data=None):
+                in_flight.append(json_data['symbol'])
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(json_data['symbol'])
+                return {'order_id': json_data['symbol']}
+
+        service = DemoService()
+        service._endpoint_executor = EndpointExecutor('bulk_broker')
+        BrokerMappingRegistry.register_broker_mapping('bulk_broker', BrokerEndpointMapping(
+            operation=OperationType.PLACE_ORDER,
+            broker_endpoint_name='place_order',
+            http_method='POST'
+        ))
+        orders = [
+            StandardOrderParams(symbol=symbol, exchange='NSE', quantity=1, order_side=OrderSide.BUY,
+                                order_type=OrderType.MARKET, product_type=ProductType.INTRADAY)
+            for symbol in ('RELIANCE', 'TCS', 'INFY')
+        ]
+        try:
+            responses = await service.place_orders_standard(orders)
+        finally:
+            BrokerMappingRegistry.unregister_broker('bulk_broker')
+
+        assert [response.data for response in responses] == [
+            {'order_id': 'RELIANCE'}, {'order_id': 'TCS'}, {'order_id': 'INFY'}
+        ]
+        assert max(peak) == 3
+
+    async def test_place_orders_standard_on_a_real_service(self):
+        """Bulk orders reach the broker with None fields dropped and extras merged"""
+        service = UpstoxService()
+        bodies = []
+
+        async def request(**kwargs):
+            bodies.append(kwargs['json_data'])
+            return {'status': 'success', 'data': {'order_id': '1'}}
+
+        service.client.request = request
+        order = StandardOrderParams(
+            symbol='RELIANCE', exchange='NSE', quantity=1, order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT, product_type=ProductType.INTRADAY,
+            price=Decimal('2500.50'), extras={'slice': True}
+        )
+
+        responses = await service.place_orders_standard([order])
+        await service.close()
+
+        assert [response.success for response in responses] == [True], responses[0].error
+        assert responses[0].data == {'status': 'success', 'data': {'order_id': '1'}}
+        assert bodies[0]['slice'] is True
+        assert 'extras' not in bodies[0]
+        assert json.loads(_json_dumps(bodies[0]))['price'] == 2500.5
+
 
 class TestRealWorldScenarios:
     """Test real-world trading scenarios"""